@@ -1,12 +1,44 @@
+import io
 import re
 import os
-from urllib.parse import quote
+import shutil
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional
 
 import requests
 import pandas as pd
 
-from ..core import API, is_similar_text, parse_period_input
-from ..utils import format_to_path
+from ..core import API, Session, similar_text_matcher, parse_period_input
+from ..utils import format_to_path, remove_accents
+
+@lru_cache(maxsize=4096)
+def _parse_fixed_date(date_string: str) -> Optional[dt.datetime]:
+    """
+    Lê datas nos formatos fixos retornados pela API (ISO 8601 ou dd/mm/aaaa), sem recorrer ao dateparser.
+
+    Parameters
+    ----------
+    date_string : str
+        Data a ser lida.
+
+    Returns
+    -------
+    Optional[dt.datetime]
+        Data lida (sem fuso horário) ou None, caso o formato não seja reconhecido.
+    """    
+    try:
+        return dt.datetime.fromisoformat(date_string).replace(tzinfo=None)
+    except ValueError:
+        pass
+    for date_format in ('%d/%m/%Y %H:%M:%S', '%d/%m/%Y'):
+        try:
+            return dt.datetime.strptime(date_string, date_format)
+        except ValueError:
+            pass
+    return None
+
 
 class DadosAbertos(API):
     """
@@ -19,15 +51,46 @@ class DadosAbertos(API):
         Pode ser obtido gratuitamente pelo [site Dados Abertos](https://dados.gov.br/dados/conteudo/como-acessar-a-api-do-portal-de-dados-abertos-com-o-perfil-de-consumidor).
     """        
     server_url = "https://dados.gov.br"
-    id_regex = re.compile(r"[0-z]{8}-([0-z]{4}-){3}[0-z]{12}")
+    id_regex = re.compile(r"[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}")
+    search_batch_size = 3
+    """Número de páginas requisitadas em paralelo por get_id()."""
     
     def __init__(self, auth_token: str):
         self.token = auth_token
         self.header = {'chave-api-dados-abertos': auth_token}
+        self.session = Session(headers=self.header)
+        self._id_cache = dict()
+    
+    @staticmethod
+    def _is_uuid(identifier: str) -> bool:
+        """
+        Verifica se [identifier] é um ID (UUID) de conjunto de dados, sem recorrer ao motor de regex.  
+        *Equivalente a id_regex.fullmatch(identifier).
+
+        Parameters
+        ----------
+        identifier : str
+            Texto a verificar.
+
+        Returns
+        -------
+        bool
+            Retorna verdadeiro se [identifier] segue o formato xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx (hexadecimal).
+        """        
+        if len(identifier) != 36 or not identifier.isascii():
+            return False
+        if identifier[8] != '-' or identifier[13] != '-' or identifier[18] != '-' or identifier[23] != '-':
+            return False
+        try:
+            # bytes.fromhex ignora espaços, por isso o tamanho do resultado também é verificado
+            return len(bytes.fromhex(identifier.replace('-', ''))) == 16
+        except ValueError:
+            return False
     
     def get_id(self, title: str, *, depth: int = 10) -> str:
         """
-        Procura por um conjunto de dados com o nome idêntico à [title] e retorna seu ID.
+        Procura por um conjunto de dados com o nome idêntico à [title] e retorna seu ID.  
+        *IDs encontrados são memorizados, evitando repetir a pesquisa na API.
 
         Parameters
         ----------
@@ -49,21 +112,47 @@ class DadosAbertos(API):
             Erro de ausência de correspondência.  
             Dá print nos conjuntos de dados com nomes semelhantes ao pesquisado.
         """
+        if (title, depth) in self._id_cache:
+            return self._id_cache[(title, depth)]
+        
         call_url = self.server_url + "/dados/api/publico/conjuntos-dados"
-        call_parameters = "?isPrivado=false&nomeConjuntoDados=" + quote(title)
+        call_parameters = {'isPrivado': 'false', 'nomeConjuntoDados': title}
+        titulo_pesquisado = title.lower()
         
-        dict_nomes_semelhantes = dict()
-        for pagina_pesquisa in range(1, depth+1):
-            query = call_url + call_parameters + f"&pagina={pagina_pesquisa}"
-            req = requests.get(query, headers=self.header)
-            
-            for conjunto in req.json():
-                titulo_conjunto = conjunto['title'].lower()
-                titulo_pesquisado = title.lower()
+        # As páginas são requisitadas em lotes paralelos, interrompendo a busca na primeira correspondência exata
+        # ou quando a última página de resultados (vazia ou incompleta) é encontrada
+        paginas = dict()
+        tamanho_pagina = 0
+        executor = ThreadPoolExecutor(max_workers=max(1, min(depth, self.search_batch_size)))
+        try:
+            for inicio_lote in range(1, depth+1, self.search_batch_size):
+                futures = dict()
+                for pagina_pesquisa in range(inicio_lote, min(inicio_lote+self.search_batch_size, depth+1)):
+                    params = call_parameters | {'pagina': pagina_pesquisa}
+                    futures[executor.submit(self.session.get_json, call_url, params=params)] = pagina_pesquisa
+                
+                # Os resultados são lidos na ordem das páginas: a primeira correspondência é a mesma da busca sequencial
+                for future, pagina_pesquisa in futures.items():
+                    conjuntos = future.result()
+                    # Os títulos em letras minúsculas são reaproveitados na busca por semelhantes
+                    titulos_conjuntos = [conjunto['title'].lower() for conjunto in conjuntos]
+                    for titulo_conjunto, conjunto in zip(titulos_conjuntos, conjuntos):
+                        if titulo_conjunto == titulo_pesquisado:
+                            self._id_cache[(title, depth)] = conjunto['id']
+                            return conjunto['id']
+                    paginas[pagina_pesquisa] = list(zip(titulos_conjuntos, conjuntos))
+                    tamanho_pagina = max(tamanho_pagina, len(conjuntos))
                 
-                if titulo_conjunto == titulo_pesquisado:
-                    return conjunto['id']
-                elif is_similar_text(titulo_pesquisado, titulo_conjunto):
+                if any(len(paginas[pagina]) < tamanho_pagina or not paginas[pagina] for pagina in futures.values()):
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        is_similar = similar_text_matcher(titulo_pesquisado, normalized=True)
+        dict_nomes_semelhantes = dict()
+        for pagina_pesquisa in sorted(paginas):
+            for titulo_conjunto, conjunto in paginas[pagina_pesquisa]:
+                if is_similar(remove_accents(titulo_conjunto)):
                     dict_nomes_semelhantes[conjunto['title']] = conjunto['id']
         raise self.NoMatchFoundError(dict_nomes_semelhantes)
     
@@ -93,23 +182,32 @@ class DadosAbertos(API):
         dict[str, str]
             Dicionário com os nomes dos recuros encontrados como chaves e seus links.
         """
-        if not self.id_regex.fullmatch(identifier):
+        if not self._is_uuid(identifier):
             identifier = self.get_id(identifier)
         
         query = self.server_url + f"/dados/api/publico/conjuntos-dados/{identifier}"
-        req = requests.get(query, headers=self.header)
+        json = self.session.get_json(query)
         
         min_date, max_date = parse_period_input(period, self.date_parser)
         
+        aceita_extensoes = file_type == 'all'
+        extensao_pesquisada = file_type.lower()
+        aceita_datas = period == 'all'
+        
         recursos_dict = dict()
-        for recurso in req.json()['recursos']:
-            extensao_errada = file_type not in [recurso['formato'].lower(), 'all']
-            data_errada = not (min_date <= self.date_parser.parse(recurso['dataCatalogacao']) <= max_date)
-            
-            if extensao_errada or data_errada:
+        for recurso in json['recursos']:
+            extensao = recurso['formato'].lower()
+            if not aceita_extensoes and extensao != extensao_pesquisada:
                 continue
             
-            key = f"{recurso['titulo']}.{recurso['formato'].lower()}"
+            if not aceita_datas:
+                data_catalogacao = _parse_fixed_date(recurso['dataCatalogacao'])
+                if data_catalogacao is None:
+                    data_catalogacao = self.date_parser.parse(recurso['dataCatalogacao'])
+                if not (min_date <= data_catalogacao <= max_date):
+                    continue
+            
+            key = f"{recurso['titulo']}.{extensao}"
             recursos_dict[key] = recurso['link']
             
         return recursos_dict
@@ -138,15 +236,54 @@ class DadosAbertos(API):
         pd.DataFrame|dict[str, pd.DataFrame]
             Data frame do conjunto de dados selecionado.
         """        
+        def read_recurso(link: str) -> pd.DataFrame:
+            # Reaproveita a sessão da API, em vez de o pandas abrir uma nova conexão a cada arquivo
+            req = API.session.get(link)
+            req.raise_for_status()
+            return pd.read_csv(io.BytesIO(req.content), **kwargs)
+        
         recursos = self.list_recursos(identifier, period=period, file_type='csv')
         if len(recursos) == 1:
-            return pd.read_csv(*[recursos.values()], **kwargs)
+            return read_recurso(next(iter(recursos.values())))
         
         dfs = dict()
-        for nome, link in recursos.items():
-            dfs[nome] = pd.read_csv(link, **kwargs)
+        if recursos:
+            with ThreadPoolExecutor(max_workers=min(len(recursos), 8)) as executor:
+                dfs = dict(zip(recursos, executor.map(read_recurso, recursos.values())))
         return pd.concat(dfs, axis=1)
     
+    def stream_data(self, identifier: str, **kwargs) -> Iterator[tuple[str, requests.Response]]:
+        """
+        Requisita os recursos encontrados sem carregar seu conteúdo em memória.  
+        *As respostas devem ser fechadas após o uso (e.g. com o bloco with).
+
+        Parameters
+        ----------
+        identifier : str
+            Título exato ou ID do conjunto de dados de interesse.
+        **kwargs** :  
+            Parâmetros passados à list_recursos() para filtrar os arquivos encontrados.
+
+        Yields
+        ------
+        tuple[str, requests.Response]
+            Nome do recurso e resposta da requisição, com o conteúdo ainda não lido (stream=True).
+        """        
+        for nome, link in self.list_recursos(identifier, **kwargs).items():
+            yield nome, self._stream_recurso(link)
+    
+    @staticmethod
+    def _stream_recurso(link: str) -> requests.Response:
+        """
+        Requisita um recurso com stream=True, levantando o erro HTTP antes da leitura do conteúdo.
+        """        
+        req = API.session.get(link, stream=True)
+        if not req.ok:
+            req.close()
+            req.raise_for_status()
+        req.raw.decode_content = True
+        return req
+    
     def download_data(self, identifier: str, output_folder: str, **kwargs) -> None:
         """
         Faz o download dos recursos encontrados em [output_folder].
@@ -160,10 +297,15 @@ class DadosAbertos(API):
         **kwargs** :  
             Parâmetros passados à list_recursos() para filtrar os arquivos encontrados.
         """
-        data = dict()
-        for nome, link in self.list_recursos(identifier, **kwargs).items():
-            data[nome] = requests.get(link).content
-        for nome, file_bytes in data.items():
-            file_name = format_to_path(nome)
-            with open(os.path.join(output_folder, file_name), 'wb') as f:
-                f.write(file_bytes)
\ No newline at end of file
+        def write_recurso(nome: str, link: str) -> None:
+            # Escreve o arquivo em disco à medida que é recebido, sem mantê-lo inteiro em memória
+            path = os.path.join(output_folder, format_to_path(nome))
+            with self._stream_recurso(link) as req, open(path, 'wb') as f:
+                shutil.copyfileobj(req.raw, f, length=1 << 20)
+        
+        # Cada recurso é requisitado pela própria tarefa: apenas as conexões em uso ficam abertas
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(write_recurso, nome, link)
+                       for nome, link in self.list_recursos(identifier, **kwargs).items()]
+        for future in futures:
+            future.result() # Propaga possíveis erros ocorridos nos downloads
\ No newline at end of file
@@ -1,55 +1,183 @@
 import re
-import os
-from pathlib import Path
-from typing import Optional
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, NamedTuple, Optional
 
-import requests
 import pandas as pd
 import numpy as np
+import requests
 
-from ..core import API, is_similar_text
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ..core import API, LazyClassAttribute, TextIndex
+from ..core import load_cached_json, save_cached_json
+from ..core.Session import json_loads
 from ..utils import invert_dict
 
 type JSON = dict[str]
 
-def _get_agregados_dict() -> dict[str, str]:
+class _Classificacao(NamedTuple):
+    """Classificação de um agregado: seu ID e as categorias disponíveis (nomes como chaves e IDs como valores)."""
+    id: int
+    categorias: dict[str, int]
+
+
+def _get_agregados_dict(force_refresh: bool = False) -> dict[str, str]:
     """
-    Lista os agregados disponíveis na API IBGE Agregados.
+    Lista os agregados disponíveis na API IBGE Agregados.  
+    *A lista é mantida em cache no disco por até 24 horas, evitando a requisição em novas sessões.  
+    *Quando instalado (apis-br[ijson]), utiliza o ijson para ler a resposta sem carregá-la inteira em memória.
+
+    Parameters
+    ----------
+    force_refresh : bool, optional
+        Ignora o cache em disco e refaz a requisição à API. Por padrão, False.
 
     Returns
     -------
     dict[str, str]
         Dicionário com nomes e códigos dos agregados.
     """    
+    if not force_refresh:
+        agregados_dict = load_cached_json('agregados.json')
+        if agregados_dict is not None:
+            return agregados_dict
+    
     agregados_dict = dict()
     query = "https://servicodados.ibge.gov.br/api/v3/agregados"
-    for pesquisa in requests.get(query).json():
-        for agregado in pesquisa['agregados']:
-            agregados_dict[agregado['nome']] = agregado['id']
+    if ijson is not None:
+        # Lê os agregados à medida que a resposta é recebida, sem montar a árvore JSON completa
+        with API.session.get(query, stream=True) as req:
+            req.raise_for_status()
+            req.raw.decode_content = True
+            for agregado in ijson.items(req.raw, 'item.agregados.item'):
+                agregados_dict[agregado['nome']] = str(agregado['id'])
+    else:
+        for pesquisa in API.session.get_json(query):
+            for agregado in pesquisa['agregados']:
+                agregados_dict[agregado['nome']] = str(agregado['id'])
+    # Uma resposta vazia não é salva, evitando que o cache esconda os agregados por 24 horas
+    if agregados_dict:
+        save_cached_json('agregados.json', agregados_dict)
     return agregados_dict
 
 
-def _get_niveis_geo_dict() -> dict[str, str]:
-    """
-    Importa o arquivo com todos os identificadores de nível geográfico
-    *Não foi encontrada uma forma de obter os identificadores via API
+_NIVEIS_GEO = {
+    'N15': 'Aglomeração Urbana',
+    'N17': 'Aglomerado Subnormal',
+    'N131': 'Amazônia Legal',
+    'N134': 'Amazônia Legal de Unidade da Federação',
+    'N20': 'Área de Divulgação da Amostra para Aglomerados Subnormais',
+    'N1105': 'Área de influência - PNSB',
+    'N18': 'Área de Ponderação',
+    'N23': 'Arranjo Populacional',
+    'N102': 'Bairro',
+    'N123': 'Bioma',
+    'N1': 'Brasil',
+    'N1100': 'Brasil, sem especificação de Unidade da Federação',
+    'N130': 'Capital/não capital de Unidade da Federação',
+    'N151': 'Categoria da Aglomeração Urbana',
+    'N71': 'Categoria Metropolitana',
+    'N33': 'Concentração Urbana',
+    'N1124': 'Coordenação Regional da Funai',
+    'N124': "Corpo d'água",
+    'N10': 'Distrito',
+    'N1102': 'Estrangeiro',
+    'N170': 'Favela e Comunidade Urbana 2022',
+    'N2': 'Grande Região',
+    'N122': 'Grande Região - PIMES',
+    'N1101': 'Ignorado',
+    'N8': 'Mesorregião Geográfica',
+    'N9': 'Microrregião Geográfica',
+    'N6': 'Município',
+    'N1011': 'Municípios Costeiros',
+    'N1013': 'Municípios de Faixa de Fronteira',
+    'N127': 'Núcleo de desertificação',
+    'N101': 'País do Mercosul, Bolívia e Chile',
+    'N128': 'Praia',
+    'N70': 'Recortes Metropolitanos',
+    'N25': 'Região Geográfica Imediata',
+    'N24': 'Região Geográfica Intermediária',
+    'N121': 'Região Hidrográfica',
+    'N14': 'Região Integrada de Desenvolvimento',
+    'N7': 'Região Metropolitana',
+    'N13': 'Região Metropolitana e Subdivisão',
+    'N132': 'Semiárido',
+    'N133': 'Semiárido de Unidade da Federação',
+    'N72': 'Subcategoria Metropolitana',
+    'N11': 'Subdistrito',
+    'N1125': 'Terra Indígena',
+    'N125': 'Terra Indígena por Unidade da Federação',
+    'N129': 'Território da Cidadania',
+    'N29': 'Território de Identidade',
+    'N1145': 'Território Quilombola',
+    'N145': 'Território Quilombola por Unidade da Federação',
+    'N1103': 'Total',
+    'N110': 'Total das áreas - PME',
+    'N103': 'Total das áreas - POF',
+    'N22': 'Total dos municípios das capitais',
+    'N21': 'Total dos municípios das capitais da Grande Região',
+    'N3': 'Unidade da Federação',
+    'N1104': 'Unidade da Federação, sem especificação de Município',
+    'N111': 'Unidade Federativa do Mercosul, Bolívia e Chile',
+}
+"""Identificadores de nível geográfico (chaves) e suas descrições (valores).  
+*Não foi encontrada uma forma de obter os identificadores via API."""
 
-    Returns
-    -------
-    dict[str, str]
-        Dicionário com os nomes e códigos de níveis geográficos.
+
+def _iter_resultados(req: requests.Response) -> Iterator[tuple[str, JSON]]:
     """
-    assets_dir = Path(os.path.abspath(__file__)).parents[1]
-    file_path = os.path.join(assets_dir, 'assets', 'ibge_level_identifiers.txt')
+    Percorre os resultados da consulta de dados de um agregado.  
+    *Quando instalado (apis-br[ijson]), lê um resultado por vez à medida que a resposta é recebida, sem montar a árvore JSON completa.
+
+    Parameters
+    ----------
+    req : requests.Response
+        Resposta da API, requisitada com stream=True (o conteúdo é lido apenas por esta função).
+
+    Yields
+    ------
+    tuple[str, JSON]
+        Nome da variável e um de seus resultados (classificações e séries por localidade).
+    """    
+    if ijson is None:
+        for variavel in json_loads(req.content):
+            for resultado in variavel['resultados']:
+                yield variavel['variavel'], resultado
+        return
     
-    localidades_dict = dict()
-    with open(file_path) as identifiers_txt:
-        for line in identifiers_txt:
-            split_point = line.find("-")
-            nivel = line[:split_point-1] # Remove o espaço antes de -
-            descricao = line[split_point+2:-1] # Remove o espaço após - e o \n no fim da linha
-            localidades_dict[nivel] = descricao
-    return localidades_dict
+    nome_variavel = None
+    builder = None
+    with req:
+        req.raw.decode_content = True
+        for prefix, event, value in ijson.parse(req.raw):
+            if prefix == 'item.variavel':
+                nome_variavel = value
+            elif prefix == 'item.resultados.item' and event == 'start_map':
+                builder = ijson.ObjectBuilder()
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'item.resultados.item' and event == 'end_map':
+                    yield nome_variavel, builder.value
+                    builder = None
+
+
+def _discard_response(future: Future) -> None:
+    """
+    Descarta uma requisição antecipada, fechando a resposta assim que ela for recebida.
+
+    Parameters
+    ----------
+    future : Future
+        Requisição (stream=True) ainda não consumida.
+    """    
+    def close_response(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+    future.add_done_callback(close_response)
 
 
 def _process_identifier_input(identifier: str, api) -> tuple[str]:
@@ -87,10 +215,39 @@ class IBGEAgregados(API):
     """
     server_url = "https://servicodados.ibge.gov.br/api/v3/agregados"
     id_regex = re.compile(r"[0-9]{4};[0-9]*")
-    agregados_dict = _get_agregados_dict()
-    """Dicionário com os agregados disponíveis (chaves) e seus IDs (valores)."""
-    niveis_geo_dict = _get_niveis_geo_dict()
+    level_regex = re.compile(r"N[0-9]+")
+    agregados_dict = LazyClassAttribute(_get_agregados_dict)
+    """Dicionário com os agregados disponíveis (chaves) e seus IDs (valores). Carregado no primeiro acesso."""
+    _agregados_index = LazyClassAttribute(lambda: TextIndex(IBGEAgregados.agregados_dict))
+    """Índice dos nomes de agregados para buscas por semelhança."""
+    niveis_geo_dict = _NIVEIS_GEO
     """Dicionário com os níveis geográficos de agregação (valores) e seus IDs (chaves)."""
+    niveis_geo_dict_inv = invert_dict(_NIVEIS_GEO)
+    """Dicionário com os níveis geográficos de agregação (chaves) e seus IDs (valores)."""
+    
+    _metadata_cache: dict[str, JSON] = dict()
+    """Metadados já obtidos, compartilhados entre as instâncias (IDs de agregado como chaves)."""
+    _variaveis_index_cache: dict[str, tuple[dict[str, list[int]], TextIndex]] = dict()
+    """Índices de variáveis já montados, compartilhados entre as instâncias (IDs de agregado como chaves)."""
+    
+    def __init__(self):
+        self._id_variavel_cache = dict()
+    
+    @classmethod
+    def update_agregados_dict(cls) -> None:
+        """
+        Atualiza o dicionário de agregados disponíveis, ignorando o cache em disco.
+        """        
+        inspect.getattr_static(cls, 'agregados_dict').reload(force_refresh=True)
+        inspect.getattr_static(cls, '_agregados_index').reload()
+    
+    @classmethod
+    def clear_metadata_cache(cls) -> None:
+        """
+        Descarta os metadados mantidos em memória, forçando sua nova leitura (do cache em disco ou da API).
+        """        
+        cls._metadata_cache.clear()
+        cls._variaveis_index_cache.clear()
     
     def get_id_agregado(self, title: str) -> str:
         """
@@ -112,18 +269,23 @@ class IBGEAgregados(API):
             Erro de ausência de correspondência.  
             Dá print nos conjuntos de dados com nomes semelhantes ao pesquisado.
         """        
-        try:
-            return self.agregados_dict[title]
-        except KeyError:
-            dict_semelhantes = dict()
-            for nome_agregado, id_agregado in self.agregados_dict.items():
-                if is_similar_text(title, nome_agregado):
-                    dict_semelhantes[f"Agregado - {nome_agregado}"] = id_agregado
-            raise self.NoMatchFoundError(dict_semelhantes)
+        id_agregado = self.agregados_dict.get(title)
+        if id_agregado is not None:
+            return id_agregado
+        
+        nome_agregado = self._agregados_index.get_exact(title)
+        if nome_agregado is not None:
+            return self.agregados_dict[nome_agregado]
+        
+        dict_semelhantes = dict()
+        for nome_agregado in self._agregados_index.get_similar(title):
+            dict_semelhantes[f"Agregado - {nome_agregado}"] = self.agregados_dict[nome_agregado]
+        raise self.NoMatchFoundError(dict_semelhantes)
     
     def get_id_variavel(self, title: str, agregado: str) -> str:
         """
-        Procura por uma variavel com o nome idêntico à [title] dentro de um agregado e retorna seu ID.
+        Procura por uma variavel com o nome idêntico à [title] dentro de um agregado e retorna seu ID.  
+        *IDs encontrados são memorizados, evitando repetir a pesquisa na API.
 
         Parameters
         ----------
@@ -145,36 +307,64 @@ class IBGEAgregados(API):
         """        
         if not agregado.isdigit():
             agregado = self.get_id_agregado(agregado)
-        query = f"{self.server_url}/{agregado}/metadados" 
-        json = requests.get(query).json()
+        if (title, agregado) in self._id_variavel_cache:
+            return self._id_variavel_cache[(title, agregado)]
         
-        out_str = ''
+        ids_variaveis, index_variaveis = self._get_variaveis_index(agregado)
+        
+        var_titles = title.split('|')
+        ids_encontrados = [str(id_variavel) for var_title in var_titles
+                           for id_variavel in ids_variaveis.get(var_title, [])]
+        if ids_encontrados:
+            out_str = '|'.join(ids_encontrados)
+            self._id_variavel_cache[(title, agregado)] = out_str
+            return out_str
+        
+        # A busca por semelhantes só é necessária na ausência de correspondências exatas
         dict_semelhantes = dict()
-        for var_title in title.split('|'):
-            for variavel in json['variaveis']:
-                if var_title == variavel['nome']:
-                    out_str += str(variavel['id']) + "|"
-                if is_similar_text(var_title, variavel['nome']):
-                    key = f"Variavel - {variavel['nome']}"
-                    id_ = f"{agregado}-{variavel['id']}"
-                    dict_semelhantes[key] = id_
-        if out_str:
-            return out_str[:-1]
+        for var_title in var_titles:
+            for nome_variavel in index_variaveis.get_similar(var_title):
+                key = f"Variavel - {nome_variavel}"
+                id_ = f"{agregado}-{ids_variaveis[nome_variavel][-1]}"
+                dict_semelhantes[key] = id_
         raise self.NoMatchFoundError(dict_semelhantes)
     
-    def get_id(self, title: str) -> str:
+    def _get_variaveis_index(self, id_agregado: str) -> tuple[dict[str, list[int]], TextIndex]:
+        """
+        Indexa os nomes das variáveis de um agregado, memorizando o índice para as próximas pesquisas.
+
+        Parameters
+        ----------
+        id_agregado : str
+            ID do agregado.
+
+        Returns
+        -------
+        tuple[dict[str, list[int]], TextIndex]
+            Dicionário com os nomes das variáveis (chaves) e seus IDs (valores) e índice dos nomes para buscas por semelhança.
+        """        
+        if id_agregado not in self._variaveis_index_cache:
+            ids_variaveis = dict()
+            for variavel in self.get_metadata(id_agregado)['variaveis']:
+                ids_variaveis.setdefault(variavel['nome'], []).append(variavel['id'])
+            self._variaveis_index_cache[id_agregado] = (ids_variaveis, TextIndex(ids_variaveis))
+        return self._variaveis_index_cache[id_agregado]
+    
+    def get_id(self, title: str|list[str]) -> str|dict[str, str]:
         """
         Procura por um conjunto de dados com o nome idêntico à [title] e retorna seu ID.
 
         Parameters
         ----------
-        title : str
-            Título a ser procurado.
+        title : str|list[str]
+            Título a ser procurado.  
+            Quando uma lista de títulos é fornecida, os metadados de cada agregado são requisitados uma única vez, em paralelo.
 
         Returns
         -------
-        str
-            ID do conjunto de dados pesquisado.
+        str|dict[str, str]
+            ID do conjunto de dados pesquisado.  
+            Para uma lista de títulos, retorna um dicionário com os títulos (chaves) e seus IDs (valores).
 
         Raises
         ------
@@ -182,6 +372,9 @@ class IBGEAgregados(API):
             Erro de ausência de correspondência.  
             Dá print nos conjuntos de dados com nomes semelhantes ao pesquisado.
         """        
+        if isinstance(title, list):
+            return self._get_id_list(title)
+        
         match title.split(";"):
             case [x, y]:
                 agregado, variavel = x, y
@@ -197,6 +390,60 @@ class IBGEAgregados(API):
         id_variavel = variavel if variavel.isdigit() else self.get_id_variavel(variavel, id_agregado)
         return f"{id_agregado};{id_variavel}"
     
+    def _get_metadata_json(self, id_agregado: str) -> JSON:
+        """
+        Obtém os metadados de um agregado, consultando primeiro os caches em memória e em disco (válido por 24 horas).
+
+        Parameters
+        ----------
+        id_agregado : str
+            ID do agregado.
+
+        Returns
+        -------
+        JSON
+            Arquivo JSON com os metadados transformado em dicionário.
+        """        
+        if id_agregado in self._metadata_cache:
+            return self._metadata_cache[id_agregado]
+        
+        cache_name = f"metadados_{id_agregado}.json"
+        json = load_cached_json(cache_name)
+        if json is None:
+            query = self.server_url+f"/{id_agregado}/metadados"
+            json = self.session.get_json(query)
+            save_cached_json(cache_name, json)
+        self._metadata_cache[id_agregado] = json
+        return json
+    
+    def _get_id_list(self, titles: list[str]) -> dict[str, str]:
+        """
+        Procura os IDs de vários títulos, requisitando os metadados de cada agregado uma única vez.
+
+        Parameters
+        ----------
+        titles : list[str]
+            Títulos a serem procurados.
+
+        Returns
+        -------
+        dict[str, str]
+            Dicionário com os títulos (chaves) e seus IDs (valores).
+        """        
+        # Títulos com variáveis não numéricas dependem dos metadados do agregado
+        agregados = set()
+        for title in titles:
+            match title.split(";"):
+                case [agregado, variavel] if not variavel.isdigit():
+                    agregados.add(agregado if agregado.isdigit() else self.get_id_agregado(agregado))
+        
+        if len(agregados) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(agregados), 8)) as executor:
+                list(executor.map(self._get_metadata_json, agregados))
+        
+        # Com os metadados em cache, a resolução de cada título dispensa novas requisições
+        return {title: self.get_id(title) for title in titles}
+    
     def get_metadata(self, identifier: str) -> JSON:
         """
         Pesquisa os metadados referentes ao agregado de interesse.
@@ -212,9 +459,80 @@ class IBGEAgregados(API):
             Arquivo JSON com os metadados transformado em dicionário.
         """        
         id_agregado = identifier if identifier.isdigit() else self.get_id_agregado(identifier)
-        
-        query = self.server_url+f"/{id_agregado}/metadados"
-        return requests.get(query).json()
+        return self._get_metadata_json(id_agregado)
+    
+    @staticmethod
+    def _get_class_dict(metadados: JSON) -> dict[str, _Classificacao]:
+        """
+        Extrai as classificações de um agregado e suas categorias.
+
+        Parameters
+        ----------
+        metadados : JSON
+            Metadados do agregado, obtidos por get_metadata().
+
+        Returns
+        -------
+        dict[str, _Classificacao]
+            Dicionário com os nomes das classificações (chaves) e seus IDs e categorias (valores).
+        """        
+        return {class_['nome']: _Classificacao(class_['id'], {cat['nome']: cat['id'] for cat in class_['categorias']})
+                for class_ in metadados['classificacoes']}
+    
+    @staticmethod
+    def _get_classify_error_msg(class_dict: dict[str, _Classificacao]) -> str:
+        """
+        Gera a mensagem de erro de [classify] inválido, listando as classificações e categorias disponíveis.
+
+        Parameters
+        ----------
+        class_dict : dict[str, _Classificacao]
+            Classificações do agregado, obtidas por _get_class_dict().
+
+        Returns
+        -------
+        str
+            Mensagem de erro.
+        """        
+        msg = ["O dicionário [classify] é inválido. Classes disponíveis:"]
+        for class_, classificacao in class_dict.items():
+            msg.append(f"{class_}:")
+            msg.extend(f"  - {cat}" for cat in classificacao.categorias)
+        return '\n'.join(msg)
+    
+    @staticmethod
+    def _get_parametro_classificacao(classify: dict[str], class_dict: dict[str, _Classificacao]) -> str:
+        """
+        Converte [classify] no parâmetro de classificação do query (e.g. "12762[117897,117898]|2[4]").
+
+        Parameters
+        ----------
+        classify : dict[str]
+            Dicionário de classificadores, como recebido por get_data().
+        class_dict : dict[str, _Classificacao]
+            Classificações do agregado, obtidas por _get_class_dict().
+
+        Returns
+        -------
+        str
+            Valor do parâmetro de classificação.
+
+        Raises
+        ------
+        ValueError
+            Erro de classificação inexistente no agregado.
+        """        
+        parametros_class = list()
+        for class_, categoria in classify.items():
+            if class_ not in class_dict:
+                raise ValueError(IBGEAgregados._get_classify_error_msg(class_dict))
+            if isinstance(categoria, str):
+                categoria = [categoria]
+            # Une o ID da classe aos IDs das categorias pertencentes a classe
+            classificacao = class_dict[class_]
+            ids_cat = [classificacao.categorias[cat] for cat in categoria]
+            parametros_class.append(f"{classificacao.id}[{','.join(map(str, ids_cat))}]")
+        return '|'.join(parametros_class)
     
     
     def get_data(self, identifier: str, level: str = 'N1', period: str = '-6', *,
@@ -276,113 +594,98 @@ class IBGEAgregados(API):
         # ----- Input handler
         id_agregado, id_variavel = _process_identifier_input(identifier, self)
         
-        if id_variavel is None:
-            msg = "Nenhuma variável fornecida. Seguem variaveis disponíveis:"
-            for var in self.get_metadata(id_agregado)['variaveis']:
-                msg += f"\n{var['nome']} : {var['id']}"
-            raise ValueError(msg)
+        if not self.level_regex.fullmatch(level):
+            # Nomes desconhecidos são mantidos e listam os níveis disponíveis na validação abaixo
+            level = self.niveis_geo_dict_inv.get(level, level)
         
         # ----- Definição do query base
-        query = self.server_url+f"/{id_agregado}/periodos/{period}/variaveis/{id_variavel}?"
-        
-        # ----- Definição dos parâmetros do query
-        # Parâmetro: Localidade
-        niveis_disponiveis = self.get_metadata(id_agregado)['nivelTerritorial']['Administrativo']
-        if not re.fullmatch("N[0-9]+", level):
-            try:
-                level = invert_dict(self.niveis_geo_dict)[level]
-            except KeyError:
-                pass
-        if level not in niveis_disponiveis:
-            msg = "O nível geográfico [level] não está disponível. Selecione:"
-            for nivel in niveis_disponiveis:
-                msg += f"\n{nivel} : {self.niveis_geo_dict[nivel]}"
-            raise ValueError(msg)
-        query += f"localidades={level}[all]"
-        
-        # Parâmetro: Categoria
-        def get_class_dict() -> dict:
-            class_dict = dict()
-            for class_ in self.get_metadata(id_agregado)['classificacoes']:
-                # Extrai nomes e IDs das categorias em um dicionário
-                categorias_dict = dict([(cat['nome'], cat['id']) for cat in class_['categorias']])
-                # Cria dicionario com valores [ID classificação, dict categorias]
-                class_dict[class_['nome']] = [class_['id'], categorias_dict]
-            return class_dict
-        
-        def get_error_msg(class_dict: dict) -> str:
-            msg = "O dicionário [classify] é inválido. Classes disponíveis:"
-            for class_, (_, cat_dict) in class_dict.items():
-                msg += f"\n{class_}:"
-                for cat in cat_dict:
-                    msg += f"\n  - {cat}"
-            return msg
+        query = self.server_url+f"/{id_agregado}/periodos/{period}/variaveis/{id_variavel}"
+        params = {'localidades': f"{level}[all]"}
         
-        def get_parametro_classificacao() -> str:
-            parametro_class = '&classificacao='
-            for class_, categoria in classify.items():
-                if class_ not in class_dict:
-                    raise ValueError(get_error_msg(class_dict))
-                if isinstance(categoria, str):
-                    categoria = [categoria]
-                # Adiciona o ID da classe ao parâmetro
-                parametro_class += f"{class_dict[class_][0]}"
-                # Adiciona os IDs das categorias pertencentes a classe
-                ids_cat = [class_dict[class_][1][cat] for cat in categoria]
-                parametro_class += str(ids_cat).replace(' ', '') + '|'
-            return parametro_class[:-1] # Remove o último caráctere pipe (|)
-        
-        # Aplica o parâmetro de classificação ao query
-        if classify is not None:
-            class_dict = get_class_dict()
-            if (not isinstance(classify, dict)) or (len(classify) == 0):
-                raise ValueError(get_error_msg(class_dict))
-            query += get_parametro_classificacao()
+        # Sem [classify], o query não depende dos metadados do agregado: os dados são requisitados
+        # em paralelo aos metadados e descartados caso algum argumento se mostre inválido.
+        # Níveis desconhecidos já são inválidos e dispensam a requisição antecipada
+        data_future = None
+        executor = None
+        if (classify is None and id_variavel is not None and level in self.niveis_geo_dict
+                and id_agregado not in self._metadata_cache):
+            executor = ThreadPoolExecutor(max_workers=1)
+            data_future = executor.submit(self.session.get, query, params=params, stream=True)
+        try:
+            metadados = self.get_metadata(id_agregado)
+            
+            if id_variavel is None:
+                msg = ["Nenhuma variável fornecida. Seguem variaveis disponíveis:"]
+                msg.extend(f"{var['nome']} : {var['id']}" for var in metadados['variaveis'])
+                raise ValueError('\n'.join(msg))
+            
+            # ----- Definição dos parâmetros do query
+            # Parâmetro: Localidade
+            niveis_disponiveis = metadados['nivelTerritorial']['Administrativo']
+            if level not in niveis_disponiveis:
+                msg = ["O nível geográfico [level] não está disponível. Selecione:"]
+                msg.extend(f"{nivel} : {self.niveis_geo_dict[nivel]}" for nivel in niveis_disponiveis)
+                raise ValueError('\n'.join(msg))
+            
+            # Parâmetro: Categoria
+            if classify is not None:
+                class_dict = self._get_class_dict(metadados)
+                if (not isinstance(classify, dict)) or (len(classify) == 0):
+                    raise ValueError(self._get_classify_error_msg(class_dict))
+                params['classificacao'] = self._get_parametro_classificacao(classify, class_dict)
+        except BaseException:
+            # A resposta antecipada é fechada sem que seu conteúdo seja recebido
+            if data_future is not None and not data_future.cancel():
+                _discard_response(data_future)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
         
         # ----- Obtenção do data frame
-        # Navegação pela árvore JSON: Metadados
-        # Coleta metadados das variáveis solicitadas (nome da variável e categorias de agregação)
-        json = requests.get(query).json()
-        
-        temp_df = pd.json_normalize(json)
-        data_name = temp_df['variavel'][0]
+        if data_future is not None:
+            req = data_future.result()
+        else:
+            req = self.session.get(query, params=params, stream=True)
+        if not req.ok:
+            req.close()
+            req.raise_for_status()
         
-        temp_df = pd.json_normalize(json, ['resultados'])
-        
-        def get_categorias(x: str) -> str:
+        def get_categorias(classificacoes: list[JSON]) -> str:
             # Extrai o nome das categorias de agregação de cada conjunto de dados
-            categorias = np.array([list(clas['categoria'].values())[0] for clas in x])
-            
             # A flag 'Total' indica que não houve agregação por alguma das categorias disponíveis
             # É mantida apenas quando nenhuma agregação é utilizada (irrelevante em outras situações)
-            categorias = categorias[categorias != 'Total']
-            if len(categorias) == 0:
-                return 'Total'
-            return ', '.join(categorias)
-        temp_df['classificacoes'] = temp_df['classificacoes'].apply(get_categorias)
-        
-        # Insere o nome base das variáveis caso seja solicitado
-        if named_var:
-            temp_df['classificacoes'] = data_name + " - " + temp_df['classificacoes']
+            categorias = [categoria for clas in classificacoes
+                          if (categoria := next(iter(clas['categoria'].values()))) != 'Total']
+            return ', '.join(categorias) or 'Total'
         
         # Navegação pela árvore JSON: Dados
-        # Acessa os valores das variáveis solicitadas
-        temp_df['series'] = temp_df['series'].apply(lambda x: pd.json_normalize(x))
-        temp_df = temp_df.set_index('classificacoes')
-        temp_df = pd.concat(temp_df.to_dict()['series'], axis=1)
-
-        # Extrai os nomes de localidade e os utiliza na indexação dos dados
-        temp_df_columns = np.array(temp_df.columns.to_list())
-        series_columns = [str(col) for col in temp_df_columns[:, 1] if col.split('.')[0] == 'serie']
-        temp_df = temp_df.loc[:, (slice(None), ['localidade.nome'] + series_columns)]
-        temp_df = temp_df.set_index((temp_df_columns[0, 0], 'localidade.nome'))
-        temp_df.index.rename(None, inplace=True)
-        temp_df = temp_df.drop(['localidade.nome'], axis=1, level=1)
-
-        # Renomeia as colunas para tornar a informação mais legível
-        new_names = pd.Series(series_columns).apply(lambda x: x.split('.')[1])
-        name_mapper = {k: v for k, v in zip(series_columns, new_names)}
-        df: pd.DataFrame = temp_df.rename(name_mapper, level=1, axis=1)
+        # Acessa os valores das variáveis solicitadas, montando o data frame a partir de um único bloco NumPy
+        # Colunas: (categorias, período), ordenadas por período | Índice: nomes de localidade
+        prefixo = None
+        periodos = dict()
+        localidades = dict()
+        for nome_variavel, resultado in _iter_resultados(req):
+            # Insere o nome base das variáveis (o da primeira variável solicitada) caso seja solicitado
+            if prefixo is None:
+                prefixo = nome_variavel + " - " if named_var else ''
+            categorias = prefixo + get_categorias(resultado['classificacoes'])
+            # Colunas do resultado, por período: evita localizar a coluna de cada valor nos dicionários aninhados
+            colunas_resultado = dict()
+            for serie in resultado['series']:
+                linha = localidades.setdefault(serie['localidade']['nome'], len(localidades))
+                for periodo, valor in serie['serie'].items():
+                    celulas = colunas_resultado.get(periodo)
+                    if celulas is None:
+                        celulas = periodos.setdefault(periodo, dict()).setdefault(categorias, dict())
+                        colunas_resultado[periodo] = celulas
+                    celulas[linha] = valor
+        colunas = [((categorias, periodo), celulas) for periodo, dados_periodo in periodos.items()
+                   for categorias, celulas in dados_periodo.items()]
+        
+        valores = np.full((len(localidades), len(colunas)), np.nan, dtype=object)
+        for coluna, (_, celulas) in enumerate(colunas):
+            valores[list(celulas), coluna] = list(celulas.values())
         
         # Trata os possíveis valores especiais retornados pela API
         if not keep_special:
@@ -392,12 +695,13 @@ class IBGEAgregados(API):
                 '...': np.nan, # Dado numérico não disponível
                 'X': np.nan # Dado numérico omitido a fim de evitar a individualização da informação
             }
-            def treat_special(x: float|str) -> float:
-                try:
-                    return float(x)
-                except ValueError:
-                    return valores_especiais[x]
-            df = df.map(treat_special)
+            # Substitui os valores especiais em todo o bloco e converte os demais textos de uma só vez
+            for especial, valor in valores_especiais.items():
+                valores[valores == especial] = valor
+            valores = valores.astype(np.float64)
+        
+        df = pd.DataFrame(valores, index=list(localidades),
+                          columns=pd.MultiIndex.from_tuples([nome for nome, _ in colunas], names=[None, None]))
         
         return df
     
@@ -1,40 +1,62 @@
 import re
-from os.path import join as join_path
+import inspect
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
 import pandas as pd
 
-from ..core import API, is_similar_text, parse_period_input
+from ..core import API, LazyClassAttribute, TextIndex, parse_period_input
+from ..core import load_cached_json, save_cached_json
 
-def _get_series_dict() -> dict[str, str]:
+def _get_series_dict(force_refresh: bool = False) -> dict[str, str]:
     """
-    Lista as séries de dados disponíveis na plataforma IPEAData.
+    Lista as séries de dados disponíveis na plataforma IPEAData.  
+    *A lista é mantida em cache no disco por até 24 horas, evitando a requisição em novas sessões.
+
+    Parameters
+    ----------
+    force_refresh : bool, optional
+        Ignora o cache em disco e refaz a requisição à API. Por padrão, False.
 
     Returns
     -------
     dict[str, str]
         Dicionário com nomes e códigos das séries de dados.
     """    
-    series_dict = dict()
+    if not force_refresh:
+        series_dict = load_cached_json('ipea_series.json')
+        if series_dict is not None:
+            return series_dict
+    
     query = "http://www.ipeadata.gov.br/api/odata4/Metadados"
-    for serie in requests.get(query).json()['value']:
-        series_dict[serie['SERNOME']] = serie['SERCODIGO']
+    series_dict = {serie['SERNOME']: serie['SERCODIGO'] for serie in API.session.get_json(query)['value']}
+    save_cached_json('ipea_series.json', series_dict)
     return series_dict
 
 
-def _get_territorios_dict() -> dict[str, str]:
+def _get_territorios_dict(force_refresh: bool = False) -> dict[str, str]:
     """
-    Lista os territórios disponíveis na plataforma IPEAData.
+    Lista os territórios disponíveis na plataforma IPEAData.  
+    *A lista é mantida em cache no disco por até 24 horas, evitando a requisição em novas sessões.
+
+    Parameters
+    ----------
+    force_refresh : bool, optional
+        Ignora o cache em disco e refaz a requisição à API. Por padrão, False.
 
     Returns
     -------
     dict[str, str]
         Dicionário com nomes de territórios e seus códigos.
     """    
-    territorios_dict = dict()
+    if not force_refresh:
+        territorios_dict = load_cached_json('ipea_territorios.json')
+        if territorios_dict is not None:
+            return territorios_dict
+    
     query = "http://www.ipeadata.gov.br/api/odata4/Territorios"
-    for territorio in requests.get(query).json()['value']:
-        territorios_dict[territorio['TERCODIGO']] = territorio['TERNOME']
+    territorios_dict = {territorio['TERCODIGO']: territorio['TERNOME'] for territorio in API.session.get_json(query)['value']}
+    save_cached_json('ipea_territorios.json', territorios_dict)
     return territorios_dict
 
 
@@ -43,15 +65,27 @@ class IPEAData(API):
     Wrapper para executar requisições na API do [IPEAData](http://www.ipeadata.gov.br/)
     """    
     server_url = "http://www.ipeadata.gov.br/api/odata4"
-    id_regex = re.compile(r"[0-Z]+(_[0-Z]+)+")
-    series_dict = _get_series_dict()
-    """Dicionário com as séries de dados disponíveis (chaves) e seus IDs (valores)."""
-    territorios_dict = _get_territorios_dict()
-    """Dicionário com os territórios disponíveis (valores) e seus IDs (chaves)""" 
+    id_regex = re.compile(r"[0-9A-Z]+(_[0-9A-Z]+)+")
+    series_dict = LazyClassAttribute(_get_series_dict)
+    """Dicionário com as séries de dados disponíveis (chaves) e seus IDs (valores). Carregado no primeiro acesso."""
+    territorios_dict = LazyClassAttribute(_get_territorios_dict)
+    """Dicionário com os territórios disponíveis (valores) e seus IDs (chaves). Carregado no primeiro acesso.""" 
+    _series_index = LazyClassAttribute(lambda: TextIndex(IPEAData.series_dict))
+    """Índice dos nomes de séries para buscas por semelhança."""
+    
+    @classmethod
+    def update_dicts(cls) -> None:
+        """
+        Atualiza os dicionários de séries e territórios disponíveis, ignorando o cache em disco.
+        """        
+        inspect.getattr_static(cls, 'series_dict').reload(force_refresh=True)
+        inspect.getattr_static(cls, 'territorios_dict').reload(force_refresh=True)
+        inspect.getattr_static(cls, '_series_index').reload()
     
     def get_id(self, title: str) -> str:
         """
-        Procura por um conjunto de dados com o nome idêntico à [title] e retorna seu ID.
+        Procura por um conjunto de dados com o nome idêntico à [title] e retorna seu ID.  
+        *Não diferencia letras maiúsculas e minúsculas.
 
         Parameters
         ----------
@@ -69,14 +103,19 @@ class IPEAData(API):
             Erro de ausência de correspondência.  
             Dá print nos conjuntos de dados com nomes semelhantes ao pesquisado.
         """        
-        try:
-            return self.series_dict[title]
-        except KeyError:
-            dict_semelhantes = dict()
-            for nome_serie, id_serie in self.series_dict.items():
-                if is_similar_text(title, nome_serie):
-                    dict_semelhantes[nome_serie] = id_serie
-            raise self.NoMatchFoundError(dict_semelhantes)
+        id_serie = self.series_dict.get(title)
+        if id_serie is not None:
+            return id_serie
+        
+        # Títulos que diferem apenas em letras maiúsculas/minúsculas ainda são correspondências exatas
+        nome_serie = self._series_index.get_exact(title)
+        if nome_serie is not None:
+            return self.series_dict[nome_serie]
+        
+        dict_semelhantes = dict()
+        for nome_serie in self._series_index.get_similar(title):
+            dict_semelhantes[nome_serie] = self.series_dict[nome_serie]
+        raise self.NoMatchFoundError(dict_semelhantes)
     
     def get_data(self, identifier: str, level: str = None,
                  period: str = 'all') -> pd.DataFrame:
@@ -105,9 +144,31 @@ class IPEAData(API):
         if not self.id_regex.fullmatch(identifier):
             identifier = self.get_id(identifier)
         
-        query = self.server_url+f"/Metadados('{identifier}')/Valores"
-        json = requests.get(query).json()
-        df = pd.DataFrame(json['value'])
+        # Os filtros de período e nível são aplicados também pelo servidor (OData $filter), reduzindo os dados recebidos.
+        # A margem de um dia cobre os fusos horários das datas (-02:00/-03:00); o filtro exato é refeito localmente
+        min_date, max_date = parse_period_input(period, self.date_parser)
+        filtros = list()
+        if period != 'all':
+            filtros.append(f"VALDATA ge {min_date - dt.timedelta(days=1):%Y-%m-%dT%H:%M:%SZ}")
+            filtros.append(f"VALDATA le {max_date + dt.timedelta(days=1):%Y-%m-%dT%H:%M:%SZ}")
+        params = dict()
+        if level is not None:
+            # Aspas simples são duplicadas, como exigido em textos literais do OData
+            nivel = level.title().replace("'", "''")
+            filtros.append(f"NIVNOME eq '{nivel}'")
+            params['$select'] = 'VALDATA,TERCODIGO,NIVNOME,VALVALOR'
+        if filtros:
+            params['$filter'] = ' and '.join(filtros)
+        
+        # Os valores, o nome da série e os territórios (no primeiro uso) são requisitados em paralelo
+        query = self.server_url+f"/Metadados('{identifier}')"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            valores_future = executor.submit(self.session.get_json, query+"/Valores", params=params)
+            metadados_future = executor.submit(self.session.get_json, query+"/")
+            executor.submit(getattr, IPEAData, 'territorios_dict')
+        json = valores_future.result()
+        # Sem valores no período (ou nível) filtrado, o data frame vazio ainda recebe as colunas esperadas
+        df = pd.DataFrame(json['value'], columns=None if json['value'] else ['SERCODIGO', 'VALDATA', 'VALVALOR', 'NIVNOME', 'TERCODIGO'])
         
         # Renomeando colunas de interesse para melhor compreensão
         rename_dict = {
@@ -119,20 +180,24 @@ class IPEAData(API):
         df = df.rename(rename_dict, axis=1)
         
         # Filtrando por período
-        df['Data'] = df['Data'].apply(lambda x: self.date_parser.parse(x).replace(tzinfo=None))
-        
-        min_date, max_date = parse_period_input(period, self.date_parser)
+        # As datas chegam em ISO 8601 com fuso horário (e.g. '2021-06-01T00:00:00-03:00'), lidas de uma só vez pelo pandas.
+        # O fuso é descartado, mantendo o horário local, e o dateparser só é usado nas datas em outros formatos
+        datas = pd.to_datetime(df['Data'].str.slice(0, 19), format='%Y-%m-%dT%H:%M:%S', errors='coerce')
+        nao_lidas = datas.isna() & df['Data'].notna()
+        if nao_lidas.any():
+            datas[nao_lidas] = df.loc[nao_lidas, 'Data'].map(lambda x: self.date_parser.parse(x).replace(tzinfo=None))
+        df['Data'] = datas
         df = df[(df['Data'] >= min_date) & (df['Data'] <= max_date)]
         
         # Tranformando códigos de território em nomes de território
-        df['Territorio'] = df['Territorio'].apply(lambda x: self.territorios_dict[x])
+        # Códigos ausentes do dicionário (e.g. cache em disco desatualizado) são mantidos, em vez de virarem NaN
+        df['Territorio'] = df['Territorio'].map(self.territorios_dict).fillna(df['Territorio'])
         
         if level is not None:
             df = df[df['Nivel'] == level.title()]
             df = df.pivot(columns='Data', index='Territorio', values='Valor')
             
-        var_name_json = requests.get(self.server_url+f"/Metadados('{identifier}')/").json()
-        var_name = var_name_json['value'][0]['SERNOME']
+        var_name = metadados_future.result()['value'][0]['SERNOME']
         return pd.concat({var_name: df}, axis=1)
     
     def download_data(self, identifier: str, output_folder: str, **kwargs) -> None:
@@ -1,10 +1,12 @@
 import re
 import os
-from typing import Optional
+from typing import Iterator, Optional
 
+import requests
 import pandas as pd
 
 from .DateParser import DateParser
+from .Session import Session
 from ..utils import format_to_path
 
 class API():
@@ -19,9 +21,11 @@ class API():
     """    
     date_parser = DateParser()
     """Parser de datas para uso interno de filtros e leitura de inputs."""
-    server_url = str()
+    session = Session()
+    """Sessão HTTP compartilhada pelas requisições à API."""
+    server_url : Optional[str] = None
     """URL do servidor da API."""
-    id_regex : re.Pattern = ''
+    id_regex : Optional[re.Pattern] = None
     """Regex para identifcar IDs dos conjuntos de dados."""
     
     def __getitem__(self, title: str) -> str:
@@ -55,6 +59,13 @@ class API():
         """
         raise NotImplementedError
     
+    def stream_data(self, identifier: str, **kwargs) -> Iterator[tuple[str, requests.Response]]:
+        """
+        Requisita os arquivos do conjunto de dados sem carregar seu conteúdo em memória.  
+        * Implementado nas classes filhas que disponibilizam arquivos para download.
+        """
+        raise NotImplementedError
+    
     def download_data(self, identifier: str, output_folder: str, **kwargs) -> None:
         """
         Faz o download do conjunto de dados encontrado em [output_folder].
@@ -69,12 +80,13 @@ class API():
             Parâmetros passados à get_data() para filtrar os dados encontrados.
         """        
         df = self.get_data(identifier, **kwargs)
-        for var, data in df.T.groupby(level=0):
+        # Seleciona as colunas de cada variável diretamente, transpondo apenas a parte salva em cada arquivo
+        for var in df.columns.unique(level=0):
             file_name = format_to_path(var) + '.csv'
             path = os.path.join(output_folder, file_name)
-            data.to_csv(path)
+            df.xs(var, axis=1, level=0, drop_level=False).T.to_csv(path)
     
-    def update_dateparser(self, new_settings: dict[str, str]) -> None:
+    def update_dateparser(self, new_settings: dict[str, str], *, languages: Optional[list[str]] = None) -> None:
         """
         Atualiza as configurações utilizadas pelo parser de datas.  
         ** DEVE SER UTILIZADO APENAS QUANDO OS FILTROS DE DATA NÃO FUNCIONAREM CORRETAMENTE **
@@ -84,8 +96,10 @@ class API():
         parsing_settings : dict
             Dicionário contendo as configurações do parser.  
             São utilizadas as [opções do dataparser](https://dateparser.readthedocs.io/en/latest/settings.html).
+        languages : Optional[list[str]], optional
+            Idiomas considerados na leitura das datas. Por padrão, None - mantém os idiomas atuais (['pt', 'en']).
         """        
-        self.date_parser.set_settings(new_settings)
+        self.date_parser.set_settings(new_settings, languages=languages)
     
     class NoMatchFoundError(Exception):
         """
@@ -94,11 +108,11 @@ class API():
         """    
         def __init__(self, semelhantes: Optional[dict] = None):
             self.semelhantes = semelhantes
-            mensagem = "Nenhuma correspondência encontrada."
-            
-            if semelhantes is not None:
-                mensagem += " Seguem possíveis resultados:"
-                for nome, id in semelhantes.items():
-                    mensagem += (f"\n{nome} : {id}")
-                
-            super().__init__(mensagem)
\ No newline at end of file
+            super().__init__("Nenhuma correspondência encontrada.")
+        
+        def __str__(self) -> str:
+            # A lista de semelhantes só é formatada quando a mensagem é exibida (erros tratados dispensam a formatação)
+            if self.semelhantes is None:
+                return "Nenhuma correspondência encontrada."
+            return '\n'.join(["Nenhuma correspondência encontrada. Seguem possíveis resultados:",
+                               *(f"{nome} : {id}" for nome, id in self.semelhantes.items())])
\ No newline at end of file
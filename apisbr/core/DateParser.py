@@ -1,16 +1,26 @@
+import re
+import datetime as dt
 from typing import Optional
 
 import dateparser
 
+_YEAR_RE = re.compile(r"[1-9][0-9]{3}")
+
 class DateParser():
     settings = {'DATE_ORDER': 'DMY', 'PREFER_DAY_OF_MONTH': 'last', 'PREFER_MONTH_OF_YEAR': 'last'}
     """Configuração para a função dateparser.parse()"""
+    languages = ['pt', 'en']
+    """Idiomas considerados pela função dateparser.parse(). Restringi-los evita a detecção entre todos os idiomas suportados."""
     
-    def __init__(self, settings: Optional[dict[str, str]] = None) -> None:
+    def __init__(self, settings: Optional[dict[str, str]] = None,
+                 languages: Optional[list[str]] = None) -> None:
         if settings is not None:
             self.settings = settings
+        if languages is not None:
+            self.languages = languages
+        self._update_settings()
     
-    def set_settings(self, settings: dict[str, str]) -> None:
+    def set_settings(self, settings: dict[str, str], *, languages: Optional[list[str]] = None) -> None:
         """
         Atualiza as configurações utilizadas pelo parser de datas.
 
@@ -19,12 +29,30 @@ class DateParser():
         parsing_settings : dict
             Dicionário contendo as configurações do parser.  
             São utilizadas as [opções do dataparser](https://dateparser.readthedocs.io/en/latest/settings.html).
+        languages : Optional[list[str]], optional
+            Idiomas considerados na leitura das datas (e.g. ['pt', 'en']). Por padrão, None - mantém os idiomas atuais.
         """        
         self.settings = settings
+        if languages is not None:
+            self.languages = languages
+        self._update_settings()
+    
+    def _update_settings(self) -> None:
+        """
+        Prepara as configurações utilizadas por parse().
+        """        
+        self._settings_first = self.settings | {'PREFER_DAY_OF_MONTH': 'first', 'PREFER_MONTH_OF_YEAR': 'first'}
+        # Anos isolados (AAAA) são lidos sem o dateparser apenas quando o resultado depende só das preferências de dia e mês
+        self._year_first = set(self.settings) <= {'DATE_ORDER', 'PREFER_DAY_OF_MONTH', 'PREFER_MONTH_OF_YEAR'}
+        self._year_last = self._year_first and self.settings.get('PREFER_DAY_OF_MONTH') == 'last' \
+                          and self.settings.get('PREFER_MONTH_OF_YEAR') == 'last'
     
     def parse(self, date_string: str, prefer_first=False):
-        settings = self.settings.copy()
-        if prefer_first:
-            settings['PREFER_DAY_OF_MONTH'] = 'first'
-            settings['PREFER_MONTH_OF_YEAR'] = 'first'
-        return dateparser.parse(date_string, settings=settings)
\ No newline at end of file
+        if _YEAR_RE.fullmatch(date_string):
+            if prefer_first and self._year_first:
+                return dt.datetime(int(date_string), 1, 1)
+            if not prefer_first and self._year_last:
+                return dt.datetime(int(date_string), 12, 31)
+        # Datas relativas (e.g. 'hoje') dependem do momento da leitura, por isso o resultado não é memorizado
+        settings = self._settings_first if prefer_first else self.settings
+        return dateparser.parse(date_string, languages=self.languages, settings=settings)
\ No newline at end of file
@@ -0,0 +1,39 @@
+import threading
+from typing import Callable
+
+_NOT_LOADED = object()
+
+class LazyClassAttribute():
+    """
+    Atributo de classe calculado apenas no primeiro acesso.  
+    *Evita que a importação do pacote dependa de requisições às APIs.
+
+    Parameters
+    ----------
+    loader : Callable
+        Função que gera o valor do atributo. É chamada sem argumentos no primeiro acesso.
+    """
+    def __init__(self, loader: Callable):
+        self.loader = loader
+        self.value = _NOT_LOADED
+        self.lock = threading.Lock()
+    
+    def __get__(self, instance, owner=None):
+        if self.value is _NOT_LOADED:
+            with self.lock:
+                if self.value is _NOT_LOADED:
+                    self.value = self.loader()
+        return self.value
+    
+    def reload(self, **kwargs) -> None:
+        """
+        Recalcula o valor do atributo.
+
+        Parameters
+        ----------
+        **kwargs** :  
+            Parâmetros passados à função [loader].
+        """
+        value = self.loader(**kwargs)
+        with self.lock:
+            self.value = value
\ No newline at end of file
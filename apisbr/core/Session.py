@@ -0,0 +1,72 @@
+import logging
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+class Session(requests.Session):
+    """
+    Sessão HTTP utilizada internamente pelas APIs.  
+    *Reaproveita conexões com o servidor (keep-alive), repete requisições em falhas temporárias e aplica um timeout padrão.  
+    *Solicita respostas comprimidas (gzip e deflate, além de brotli quando instalado - apis-br[brotli]).
+
+    Parameters
+    ----------
+    timeout : tuple[float, float], optional
+        Timeout padrão das requisições, no formato (conexão, leitura), em segundos.  
+        Por padrão, (10, 120).
+    headers : Optional[dict[str, str]], optional
+        Cabeçalhos enviados em todas as requisições da sessão (e.g. tokens de autenticação).
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    """Política de novas tentativas para falhas temporárias do servidor. Respeita o cabeçalho Retry-After."""
+    
+    def __init__(self, timeout: tuple[float, float] = (10, 120),
+                 headers: Optional[dict[str, str]] = None):
+        super().__init__()
+        self.timeout = timeout
+        if headers is not None:
+            self.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=self.retries)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        # Os queries são registrados apenas quando o nível DEBUG é habilitado (e.g. logging.basicConfig(level=logging.DEBUG))
+        logger.debug("%s %s %s", method, url, kwargs.get('params') or '')
+        return super().request(method, url, **kwargs)
+    
+    def get_json(self, url: str, **kwargs) -> Any:
+        """
+        Requisita [url] e retorna o conteúdo JSON da resposta.  
+        *Utiliza o orjson na leitura, quando instalado (apis-br[orjson]), lendo diretamente os bytes recebidos.
+
+        Parameters
+        ----------
+        url : str
+            URL a ser requisitado.
+        **kwargs** :  
+            Parâmetros passados à função requests.Session.get().
+
+        Returns
+        -------
+        Any
+            Conteúdo JSON transformado em objetos Python.
+
+        Raises
+        ------
+        requests.HTTPError
+            Erro de resposta do servidor (status 4xx ou 5xx), em vez de uma falha ao ler a página de erro como JSON.
+        """
+        req = self.get(url, **kwargs)
+        req.raise_for_status()
+        return json_loads(req.content)
\ No newline at end of file
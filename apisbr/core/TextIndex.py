@@ -0,0 +1,133 @@
+from typing import Iterable, Optional
+
+from ..utils import remove_accents
+
+_MAX_SIMILAR_CACHE = 1024
+"""Número máximo de pesquisas de semelhantes memorizadas por índice."""
+_MAX_WORD_CACHE = 4096
+"""Número máximo de palavras pesquisadas memorizadas por índice."""
+
+def _memorize(cache: dict, key: str, value, maxsize: int):
+    """
+    Guarda [value] em [cache], reiniciando o cache quando ele atinge [maxsize] entradas.  
+    *O reinício com clear() dispensa travas entre threads, ao contrário da remoção entrada a entrada.
+
+    Parameters
+    ----------
+    cache : dict
+        Cache da instância de TextIndex.
+    key : str
+        Texto pesquisado.
+    value : Any
+        Resultado da pesquisa.
+    maxsize : int
+        Número máximo de entradas do cache.
+
+    Returns
+    -------
+    Any
+        O próprio [value].
+    """    
+    if len(cache) >= maxsize:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+class TextIndex():
+    """
+    Índice de títulos para agilizar buscas em catálogos extensos (e.g. agregados do IBGE).  
+    *Indexa os títulos por palavra, restringindo a busca de semelhantes aos títulos candidatos.
+
+    Parameters
+    ----------
+    titles : Iterable[str]
+        Títulos a indexar.
+    """    
+    def __init__(self, titles: Iterable[str]):
+        self.titles = list(titles)
+        """Títulos indexados, na ordem original."""
+        self.by_lower = dict()
+        """Dicionário com os títulos em letras minúsculas (chaves) e os títulos originais (valores)."""
+        self.by_word = dict()
+        """Dicionário com as palavras normalizadas (chaves) e as posições dos títulos que as contêm (valores)."""
+        
+        # Pesquisas repetidas (e.g. novas tentativas com o mesmo erro de digitação) reaproveitam o resultado
+        self._similar_cache: dict[str, tuple[str, ...]] = dict()
+        """Dicionário com os títulos pesquisados (chaves) e os títulos semelhantes encontrados (valores)."""
+        # Palavras comuns a pesquisas diferentes (e.g. 'populacao') percorrem o vocabulário uma única vez
+        self._word_cache: dict[str, frozenset[int]] = dict()
+        """Dicionário com as palavras pesquisadas (chaves) e as posições dos títulos que as contêm (valores)."""
+        
+        for posicao, title in enumerate(self.titles):
+            self.by_lower.setdefault(title.lower(), title)
+            for palavra in remove_accents(title).lower().split():
+                self.by_word.setdefault(palavra, set()).add(posicao)
+    
+    def get_exact(self, title: str) -> Optional[str]:
+        """
+        Procura um título idêntico a [title], sem diferenciar letras maiúsculas e minúsculas.
+
+        Parameters
+        ----------
+        title : str
+            Título a ser procurado.
+
+        Returns
+        -------
+        Optional[str]
+            Título original encontrado ou None, caso não haja correspondência.
+        """        
+        return self.by_lower.get(title.lower())
+    
+    def get_similar(self, title: str) -> list[str]:
+        """
+        Lista os títulos semelhantes a [title], segundo o critério de is_similar_text().  
+        *Os resultados de até 1024 pesquisas são memorizados (o cache é reiniciado ao atingir o limite).
+
+        Parameters
+        ----------
+        title : str
+            Título a ser procurado.
+
+        Returns
+        -------
+        list[str]
+            Títulos semelhantes, na ordem original.
+        """        
+        semelhantes = self._similar_cache.get(title)
+        if semelhantes is None:
+            semelhantes = _memorize(self._similar_cache, title, self._search_similar(title), _MAX_SIMILAR_CACHE)
+        return list(semelhantes)
+    
+    def _search_similar(self, title: str) -> tuple[str, ...]:
+        """
+        Pesquisa os títulos semelhantes a [title] no índice. Utilizada (e memorizada) por get_similar().
+        """        
+        palavras = set(remove_accents(title).lower().split())
+        if not palavras:
+            return tuple(self.titles)
+        
+        # Uma palavra pesquisada sem espaços só pode estar contida em uma única palavra do título.
+        # Assim, os candidatos restantes já são exatamente os títulos semelhantes, sem nova verificação.
+        # Palavras mais longas costumam ser mais seletivas e são processadas primeiro.
+        candidatos = None
+        for palavra in sorted(palavras, key=len, reverse=True):
+            posicoes = self._word_cache.get(palavra)
+            if posicoes is None:
+                posicoes = _memorize(self._word_cache, palavra, self._search_word(palavra), _MAX_WORD_CACHE)
+            candidatos = set(posicoes) if candidatos is None else candidatos & posicoes
+            if not candidatos:
+                return tuple()
+        
+        return tuple(self.titles[posicao] for posicao in sorted(candidatos))
+    
+    def _search_word(self, palavra: str) -> frozenset[int]:
+        """
+        Lista as posições dos títulos com alguma palavra que contém [palavra]. Utilizada (e memorizada) por _search_similar().
+        """        
+        posicoes = set()
+        for palavra_indexada, posicoes_palavra in self.by_word.items():
+            if palavra in palavra_indexada:
+                posicoes |= posicoes_palavra
+        return frozenset(posicoes)
\ No newline at end of file
@@ -1,3 +1,7 @@
 from .API import API
 from .DateParser import DateParser
-from .apis_internal_functions import *
\ No newline at end of file
+from .LazyClassAttribute import LazyClassAttribute
+from .Session import Session
+from .TextIndex import TextIndex
+from .apis_internal_functions import *
+from .cache_functions import *
\ No newline at end of file
@@ -1,8 +1,12 @@
+import re
 import datetime as dt
+from typing import Callable
 
 from .DateParser import DateParser
 from ..utils import remove_accents
 
+__all__ = ['MinDate', 'MaxDate', 'is_similar_text', 'similar_text_matcher', 'parse_period_input']
+
 type MinDate = dt.datetime
 type MaxDate = dt.datetime
 
@@ -22,9 +26,37 @@ def is_similar_text(target: str, current: str) -> bool:
     bool
         Retorna verdadeiro se todas as palavras de [target] estão em [current].
     """
-    target = remove_accents(target).lower()
+    palavras = set(remove_accents(target).lower().split())
     current = remove_accents(current).lower()
-    return all(palavra in current for palavra in target.split())
+    # Palavras inteiras de [current] são encontradas por pertinência ao conjunto, sem percorrer o texto
+    palavras -= set(current.split())
+    return all(palavra in current for palavra in palavras)
+
+
+def similar_text_matcher(target: str, *, normalized: bool = False) -> Callable[[str], bool]:
+    """
+    Gera uma função equivalente a is_similar_text() com [target] fixo.  
+    *Normaliza [target] e compila a verificação uma única vez, agilizando a comparação com muitos textos.
+
+    Parameters
+    ----------
+    target : str
+        Texto sendo buscado.
+    normalized : bool, optional
+        Indica que os textos [current] já chegam normalizados (sem acentos e em letras minúsculas),
+        dispensando a normalização a cada comparação. Por padrão, False.
+
+    Returns
+    -------
+    Callable[[str], bool]
+        Função que recebe [current] e retorna verdadeiro se todas as palavras de [target] estão em [current].
+    """
+    palavras = remove_accents(target).lower().split()
+    # Um lookahead por palavra: a verificação ocorre em uma única passagem do motor de regex
+    pattern = re.compile(''.join(f"(?=.*{re.escape(palavra)})" for palavra in palavras), re.DOTALL)
+    if normalized:
+        return lambda current: pattern.match(current) is not None
+    return lambda current: pattern.match(remove_accents(current).lower()) is not None
 
 
 def parse_period_input(period: str, date_parser: DateParser = DateParser()) -> tuple[MinDate, MaxDate]:
@@ -51,12 +83,12 @@ def parse_period_input(period: str, date_parser: DateParser = DateParser()) -> t
     Raises
     ------
     ValueError
-        _description_
+        Formato de [period] não reconhecido (e.g. mais de duas datas separadas por '-').
     """
+    if period == 'all':
+        return dt.datetime.min, dt.datetime.max
+    
     match period.split('-'):
-        case ['all']:
-            min_date = dt.datetime.min
-            max_date = dt.datetime.max
         case [x]:
             d = date_parser.parse(x)
             min_date = dt.datetime(d.year, 1, 1)
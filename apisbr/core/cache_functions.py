@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+import time
+from typing import Any, Optional
+
+__all__ = ['get_cache_dir', 'load_cached_json', 'save_cached_json', 'clear_cached_json']
+
+CACHE_MAX_AGE = 24 * 60 * 60
+"""Tempo máximo (em segundos) para reaproveitar um arquivo do cache em disco. Por padrão, 24 horas."""
+
+def get_cache_dir() -> str:
+    """
+    Retorna a pasta utilizada para o cache em disco do pacote.  
+    *Pode ser alterada pela variável de ambiente APISBR_CACHE_DIR.
+
+    Returns
+    -------
+    str
+        Caminho da pasta de cache.
+    """
+    if 'APISBR_CACHE_DIR' in os.environ:
+        return os.environ['APISBR_CACHE_DIR']
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+    elif sys.platform == 'darwin':
+        base_dir = os.path.expanduser('~/Library/Caches')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return os.path.join(base_dir, 'apisbr')
+
+
+def load_cached_json(name: str, max_age: float = CACHE_MAX_AGE) -> Optional[Any]:
+    """
+    Lê um arquivo JSON do cache em disco.
+
+    Parameters
+    ----------
+    name : str
+        Nome do arquivo no cache (e.g. 'agregados.json').
+    max_age : float, optional
+        Idade máxima (em segundos) do arquivo para que seja reaproveitado.  
+        Por padrão, CACHE_MAX_AGE (24 horas).
+
+    Returns
+    -------
+    Optional[Any]
+        Conteúdo do arquivo ou None, caso não exista, esteja expirado ou corrompido.
+    """
+    path = os.path.join(get_cache_dir(), name)
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_json(name: str, data: Any) -> None:
+    """
+    Salva [data] no cache em disco, no formato JSON.  
+    *Falhas de escrita são ignoradas: o cache é apenas uma otimização.
+
+    Parameters
+    ----------
+    name : str
+        Nome do arquivo no cache (e.g. 'agregados.json').
+    data : Any
+        Conteúdo serializável em JSON.
+    """
+    cache_dir = get_cache_dir()
+    path = os.path.join(cache_dir, name)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path) # Evita que leituras simultâneas encontrem o arquivo incompleto
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def clear_cached_json(name: Optional[str] = None) -> None:
+    """
+    Remove arquivos do cache em disco, forçando novas requisições às APIs.
+
+    Parameters
+    ----------
+    name : Optional[str], optional
+        Nome do arquivo a ser removido (e.g. 'agregados.json').  
+        Por padrão, remove todos os arquivos JSON do cache.
+    """
+    cache_dir = get_cache_dir()
+    try:
+        names = [name] if name is not None else [f for f in os.listdir(cache_dir) if f.endswith('.json')]
+    except OSError:
+        return
+    for cache_name in names:
+        try:
+            os.remove(os.path.join(cache_dir, cache_name))
+        except OSError:
+            pass
\ No newline at end of file
@@ -1,15 +1,115 @@
-import requests
+import inspect
 
+from ..core import API, LazyClassAttribute, load_cached_json, save_cached_json
 from ..utils import invert_dict, remove_accents
+from .uf_naming_funcs import _VALID_UF_ABBREVS
+
+__all__ = ['IBGELocalidades', 'get_muni_name', 'get_muni_id']
+
+def _get_municipios_dict(force_refresh: bool = False) -> dict[str, int]:
+    """
+    Lista os municípios brasileiros disponíveis na API de localidades do IBGE.  
+    *A lista é mantida em cache no disco por até 24 horas, evitando a requisição em novas sessões.
+
+    Parameters
+    ----------
+    force_refresh : bool, optional
+        Ignora o cache em disco e refaz a requisição à API. Por padrão, False.
+
+    Returns
+    -------
+    dict[str, int]
+        Dicionário com nomes dos municípios no formato 'Nome Do Municipio - UF' e seus IDs de 7 dígitos.
+    """    
+    if not force_refresh:
+        municipios_dict = load_cached_json('ibge_municipios.json')
+        if municipios_dict is not None:
+            return municipios_dict
+    
+    query = IBGELocalidades.server_url + "/municipios"
+    municipios_dict = {f"{remove_accents(municipio['nome']).title()} - {municipio['regiao-imediata']['regiao-intermediaria']['UF']['sigla']}":
+                       municipio['id'] for municipio in IBGELocalidades.session.get_json(query)}
+    save_cached_json('ibge_municipios.json', municipios_dict)
+    return municipios_dict
+
 
 class IBGELocalidades():
     server_url = "https://servicodados.ibge.gov.br/api/v1/localidades"
+    session = API.session
+    """Sessão HTTP compartilhada com as APIs (reaproveita as conexões com o servidor do IBGE)."""
+    _name2id = LazyClassAttribute(_get_municipios_dict)
+    """Dicionário com os nomes dos municípios (chaves) e seus IDs de 7 dígitos (valores). Carregado no primeiro acesso."""
+    _id2name = LazyClassAttribute(lambda: invert_dict(IBGELocalidades._name2id))
+    """Dicionário com os IDs de 7 dígitos dos municípios (chaves) e seus nomes (valores)."""
+    _id6_2name = LazyClassAttribute(lambda: {id_municipio//10: nome for id_municipio, nome in IBGELocalidades._id2name.items()})
+    """Dicionário com os IDs de 6 dígitos (sem o dígito verificador) dos municípios (chaves) e seus nomes (valores)."""
+    
+    @classmethod
+    def update_id_dicts(cls) -> None:
+        """
+        Atualiza os dicionários de municípios, ignorando o cache em disco.
+        """        
+        inspect.getattr_static(cls, '_name2id').reload(force_refresh=True)
+        inspect.getattr_static(cls, '_id2name').reload()
+        inspect.getattr_static(cls, '_id6_2name').reload()
+    
+    @classmethod
+    def name_to_id(cls, name: str, *, verifier: bool = True) -> int:
+        """
+        Retorna o código IBGE de localidade de um município, consultando diretamente o dicionário de municípios.
+
+        Parameters
+        ----------
+        name : str
+            Nome do município no formato 'Nome Do Municipio - UF'.
+        verifier : bool, optional
+            Inclui o dígito verificador para IDs de 7 dígitos (True) ou utiliza IDs de 6 dígitos (False).  
+            Por padrão, True.
+
+        Returns
+        -------
+        int
+            Código de localidade IBGE.
+
+        Raises
+        ------
+        KeyError
+            Município não encontrado.
+        """        
+        id_municipio = cls._name2id[name]
+        return id_municipio if verifier else id_municipio//10
+    
+    @classmethod
+    def id_to_name(cls, id_: int, *, verifier: bool = True) -> str:
+        """
+        Retorna o nome de um município a partir de seu código IBGE, consultando diretamente o dicionário de municípios.
+
+        Parameters
+        ----------
+        id_ : int
+            Código de localidade IBGE.
+        verifier : bool, optional
+            Indica se [id_] inclui o dígito verificador (7 dígitos, True) ou não (6 dígitos, False).  
+            Por padrão, True.
+
+        Returns
+        -------
+        str
+            Nome do município no formato 'Nome Do Municipio - UF'.
+
+        Raises
+        ------
+        KeyError
+            Código não encontrado.
+        """        
+        return cls._id2name[id_] if verifier else cls._id6_2name[id_]
     
     @classmethod
     def get_id_dict(cls, key: str = 'nome', *, verifier: bool = True) -> dict[str, int]|dict[int, str]:
         """
         Gera um dicionário com todos os códigos IBGE de localidade dos municípios brasileiros.  
-        *Nomes de municípios no formato 'Nome Do Municipio - UF'.
+        *Nomes de municípios no formato 'Nome Do Municipio - UF'.  
+        *A lista de municípios é requisitada uma única vez por sessão (atualizada por update_id_dicts()).
 
         Parameters
         ----------
@@ -39,15 +139,12 @@ class IBGELocalidades():
                 invert = True
             case _:
                 raise ValueError("Valor inválido para o parâmetro 'key'.")
-        query = cls.server_url + "/municipios"
-        id_dict = dict()
-        for municipio in requests.get(query).json():
-            uf = municipio['regiao-imediata']['regiao-intermediaria']['UF']['sigla']
-            value = municipio['id'] if verifier else int(municipio['id']/10)
-            id_dict[f"{remove_accents(municipio['nome']).title()} - {uf}"] = value
+        # Os dicionários são montados uma única vez; cópias evitam que alterações do usuário afetem os demais usos
+        if verifier:
+            return dict(cls._id2name) if invert else dict(cls._name2id)
         if invert:
-            id_dict = invert_dict(id_dict)
-        return id_dict
+            return dict(cls._id6_2name)
+        return {nome: id_municipio//10 for nome, id_municipio in cls._name2id.items()}
 
 def get_muni_name(ibge_id: str|int) -> str:
     """
@@ -63,13 +160,9 @@ def get_muni_name(ibge_id: str|int) -> str:
     str
         Nome do município no formato 'Nome Do Municipio - UF'.
     """
-    verifier = False
-    if isinstance(ibge_id, int):
-        ibge_id = str(ibge_id)
-    if len(ibge_id) == 7:
-        verifier = True
+    verifier = len(str(ibge_id)) == 7
     try:
-        return IBGELocalidades.get_id_dict('id', verifier=verifier)[int(ibge_id)]
+        return IBGELocalidades.id_to_name(int(ibge_id), verifier=verifier)
     except KeyError:
         raise KeyError("Identificador IBGE inválido.")
 
@@ -93,9 +186,19 @@ def get_muni_id(muni_name: str, uf: str, verifier: bool = True) -> int:
     -------
     int
         Código de localidade IBGE.
+
+    Raises
+    ------
+    ValueError
+        Sigla de UF inválida.
+    KeyError
+        Município não encontrado na UF informada.
     """
-    muni_name = remove_accents(muni_name).title() + ' - ' + uf.upper()
+    uf = uf.upper()
+    if uf not in _VALID_UF_ABBREVS:
+        raise ValueError(f"Sigla de UF inválida: '{uf}'.")
+    muni_name = remove_accents(muni_name).title() + ' - ' + uf
     try:
-        return IBGELocalidades.get_id_dict(verifier=verifier)[muni_name]
+        return IBGELocalidades.name_to_id(muni_name, verifier=verifier)
     except KeyError:
         raise KeyError("Nome de município não encontrado.")
\ No newline at end of file
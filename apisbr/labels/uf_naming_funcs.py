@@ -33,6 +33,12 @@ _uf_name2abbrev ={
 
 _uf_abbrev2name = invert_dict(_uf_name2abbrev)
 
+_VALID_UF_ABBREVS = frozenset(_uf_name2abbrev.values())
+"""Siglas válidas de UF, para verificar inputs antes de consultas mais custosas."""
+
+_uf_name2abbrev_norm = {name.casefold(): abbrev for name, abbrev in _uf_name2abbrev.items()}
+"""Siglas das UFs indexadas pelos nomes já normalizados (sem acento e casefold), consultados por get_uf_abbrev()."""
+
 def get_uf_abbrev(uf_name: str) -> str:
     """
     Recebe o nome de uma UF e retorna sua abreviação (SC, MT, DF...).
@@ -47,8 +53,7 @@ def get_uf_abbrev(uf_name: str) -> str:
     str
         Sigla referente à UF em letras maiúsculas.
     """
-    name = remove_accents(uf_name).title()
-    return _uf_name2abbrev[name]
+    return _uf_name2abbrev_norm[remove_accents(uf_name).casefold()]
 
 def get_uf_name(uf_abbrev: str) -> str:
     """
@@ -12,7 +12,4 @@ def invert_dict(dict_: dict) -> dict:
     dict
         Dicionário invertido.
     """    
-    new_dict = dict()
-    for key, value in dict_.copy().items():
-        new_dict[value] = key
-    return new_dict
\ No newline at end of file
+    return dict(zip(dict_.values(), dict_.keys()))
\ No newline at end of file
@@ -1,3 +1,11 @@
+import re
+from unicodedata import normalize, category
+
+__all__ = ['remove_accents', 'remove_hyphen', 'format_to_path']
+
+_COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+"""Acentos combinados (bloco Combining Diacritical Marks), separados das letras pela normalização NFD."""
+
 def remove_accents(text: str) -> str:
     """
     Remove os acentos do texto.
@@ -12,9 +20,13 @@ def remove_accents(text: str) -> str:
     str
         Texto sem acentos.
     """    
-    from unicodedata import normalize, category
-    
-    return ''.join(c for c in normalize('NFD', text) if category(c) != 'Mn')
+    if text.isascii():
+        return text
+    text = _COMBINING_MARKS.sub('', normalize('NFD', text))
+    if text.isascii():
+        return text
+    # Demais marcas não espaçadas (e.g. de outros alfabetos) são verificadas caractere a caractere
+    return ''.join(c for c in text if category(c) != 'Mn')
 
 
 def remove_hyphen(text: str) -> str:
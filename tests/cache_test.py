@@ -0,0 +1,41 @@
+import os
+import time
+
+import pytest
+
+from apisbr.core import load_cached_json, save_cached_json, clear_cached_json
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("APISBR_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+class TestDiskCache():
+    @pytest.mark.core
+    def test_save_and_load(self, cache_dir):
+        data = {"Número de unidades locais": "1685"}
+        save_cached_json("agregados.json", data)
+        assert load_cached_json("agregados.json") == data
+    
+    def test_missing_file(self, cache_dir):
+        assert load_cached_json("inexistente.json") is None
+    
+    def test_expired_file(self, cache_dir):
+        save_cached_json("agregados.json", {"a": 1})
+        old_time = time.time() - 3600
+        os.utime(os.path.join(cache_dir, "agregados.json"), (old_time, old_time))
+        assert load_cached_json("agregados.json", max_age=60) is None
+    
+    def test_corrupted_file(self, cache_dir):
+        with open(os.path.join(cache_dir, "agregados.json"), "w") as f:
+            f.write("{")
+        assert load_cached_json("agregados.json") is None
+    
+    def test_clear_cache(self, cache_dir):
+        save_cached_json("agregados.json", {"a": 1})
+        save_cached_json("ipea_series.json", {"b": 2})
+        clear_cached_json("agregados.json")
+        assert load_cached_json("agregados.json") is None
+        assert load_cached_json("ipea_series.json") == {"b": 2}
+        clear_cached_json()
+        assert load_cached_json("ipea_series.json") is None
\ No newline at end of file
@@ -0,0 +1,111 @@
+import io
+import time
+import threading
+
+import pytest
+
+from apisbr.api import DadosAbertos
+from apisbr.core import API
+
+def conjunto(n: int) -> dict:
+    return {'title': f"Conjunto {n}", 'id': f"{n:08d}-0000-0000-0000-000000000000"}
+
+@pytest.fixture
+def api(monkeypatch):
+    # Páginas com 2 conjuntos cada; a página 4 é incompleta (última página de resultados)
+    paginas = {1: [conjunto(1), conjunto(2)], 2: [conjunto(3), conjunto(4)],
+               3: [conjunto(5), conjunto(6)], 4: [conjunto(7)]}
+    api = DadosAbertos("token")
+    api.paginas_requisitadas = list()
+    def fake_get_json(url, params):
+        api.paginas_requisitadas.append(params['pagina'])
+        return paginas.get(params['pagina'], [])
+    monkeypatch.setattr(api.session, 'get_json', fake_get_json)
+    return api
+
+class TestGetId():
+    @pytest.mark.core
+    def test_exact_match(self, api):
+        assert api.get_id("conjunto 3") == conjunto(3)['id']
+        assert sorted(api.paginas_requisitadas) == [1, 2, 3]
+    
+    def test_stops_at_short_page(self, api):
+        with pytest.raises(DadosAbertos.NoMatchFoundError) as e:
+            api.get_id("conjunto", depth=10)
+        # Os lotes de 3 páginas param no lote que contém a página incompleta
+        assert sorted(api.paginas_requisitadas) == [1, 2, 3, 4, 5, 6]
+        assert list(e.value.semelhantes) == [f"Conjunto {n}" for n in range(1, 8)]
+    
+    def test_first_page_wins(self, api, monkeypatch):
+        # O mesmo título em duas páginas do lote: vale a primeira página, mesmo que responda por último
+        def fake_get_json(url, params):
+            if params['pagina'] == 1:
+                time.sleep(0.1)
+                return [conjunto(1)]
+            return [{'title': "Conjunto 1", 'id': "duplicado"}]
+        monkeypatch.setattr(api.session, 'get_json', fake_get_json)
+        assert api.get_id("conjunto 1") == conjunto(1)['id']
+    
+    def test_non_positive_depth(self, api):
+        with pytest.raises(DadosAbertos.NoMatchFoundError):
+            api.get_id("conjunto", depth=0)
+        assert api.paginas_requisitadas == []
+
+
+
+class TestIsUuid():
+    def test_is_uuid(self):
+        assert DadosAbertos._is_uuid("7ed7c95a-ec15-45ed-a4cd-1c07fe70d45d")
+    
+    @pytest.mark.parametrize("text", [
+        "7ed7c95a-ec15-45ed-a4cd-1c07fe70d45",
+        "7ed7c95a-ec15-45ed-a4cd 1c07fe70d45d",
+        "7ed7c95a-ec15-45ed-a4cd-1c07fe70d4 d",
+        "bolsa família",
+        ])
+    def test_is_not_uuid(self, text):
+        assert not DadosAbertos._is_uuid(text)
+
+
+class SlowBytesIO(io.BytesIO):
+    def read(self, *args):
+        time.sleep(0.02) # Simula o recebimento do conteúdo pela rede
+        return super().read(*args)
+
+class FakeStream():
+    ok = True
+    abertas = 0
+    max_abertas = 0
+    lock = threading.Lock()
+    
+    def __init__(self, link: str):
+        self.raw = SlowBytesIO(link.encode())
+        with self.lock:
+            FakeStream.abertas += 1
+            FakeStream.max_abertas = max(FakeStream.max_abertas, FakeStream.abertas)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    def close(self):
+        if not self.raw.closed:
+            self.raw.close()
+            with self.lock:
+                FakeStream.abertas -= 1
+
+class TestDownloadData():
+    def test_opens_one_response_per_worker(self, tmp_path, monkeypatch):
+        recursos = {f"recurso {n}.csv": f"https://dados.gov.br/{n}.csv" for n in range(20)}
+        api = DadosAbertos("token")
+        monkeypatch.setattr(api, 'list_recursos', lambda identifier, **kwargs: recursos)
+        # Os recursos são baixados pela sessão compartilhada, sem o token de acesso
+        monkeypatch.setattr(API.session, 'get', lambda link, **kwargs: FakeStream(link))
+        monkeypatch.setattr(FakeStream, 'max_abertas', 0)
+        api.download_data("conjunto", str(tmp_path))
+        # As respostas são abertas pelas tarefas, não todas antes da primeira escrita
+        assert FakeStream.max_abertas <= 8
+        assert FakeStream.abertas == 0
+        assert sorted(f.read_text() for f in tmp_path.iterdir()) == sorted(recursos.values())
\ No newline at end of file
@@ -0,0 +1,120 @@
+import io
+import json
+import inspect
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from apisbr.api import IBGEAgregados
+
+METADADOS = {
+    'id': 1234,
+    'nivelTerritorial': {'Administrativo': ['N1', 'N3']},
+    'variaveis': [{'id': 93, 'nome': "População residente"}],
+    'classificacoes': [],
+}
+
+def resultado(categoria: str, series: dict[str, dict[str, str]]) -> dict:
+    return {'classificacoes': [{'id': 2, 'nome': "Sexo", 'categoria': {'1': categoria}}],
+            'series': [{'localidade': {'nome': localidade}, 'serie': serie} for localidade, serie in series.items()]}
+
+def variavel(*resultados: dict) -> list[dict]:
+    return [{'id': '93', 'variavel': "População residente", 'resultados': list(resultados)}]
+
+DADOS = variavel(
+    resultado("Homens", {'Rondônia': {'2010': '100', '2022': '-'}, 'Acre': {'2010': '..', '2022': '300'}}),
+    resultado("Mulheres", {'Rondônia': {'2010': 'X', '2022': '150'}, 'Acre': {'2010': '...', '2022': '250'}}),
+)
+
+class FakeResponse():
+    ok = True
+    
+    def __init__(self, dados: list[dict]):
+        self.content = json.dumps(dados).encode()
+        self.raw = io.BytesIO(self.content)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    def close(self):
+        self.raw.close()
+
+@pytest.fixture(params=['json', 'ijson'])
+def api(request, tmp_path, monkeypatch):
+    # Metadados e dados simulados, sem acesso à API nem ao cache do usuário
+    # Os dados são lidos de uma só vez (json) ou à medida que são recebidos (ijson)
+    if request.param == 'ijson':
+        pytest.importorskip('ijson')
+    else:
+        monkeypatch.setattr(inspect.getmodule(IBGEAgregados), 'ijson', None)
+    monkeypatch.setenv("APISBR_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(IBGEAgregados, '_metadata_cache', dict())
+    monkeypatch.setattr(IBGEAgregados.session, 'get_json', lambda url, **kwargs: METADADOS)
+    api = IBGEAgregados()
+    api.dados = DADOS
+    api.respostas = list()
+    def fake_get(url, **kwargs):
+        api.respostas.append(FakeResponse(api.dados))
+        return api.respostas[-1]
+    monkeypatch.setattr(IBGEAgregados.session, 'get', fake_get)
+    return api
+
+class TestGetData():
+    @pytest.mark.core
+    def test_frame_shape(self, api):
+        df = api.get_data("1234;93", level='N3')
+        assert df.index.tolist() == ['Rondônia', 'Acre']
+        # Colunas (categorias, período), ordenadas por período
+        assert df.columns.tolist() == [("População residente - Homens", '2010'),
+                                       ("População residente - Mulheres", '2010'),
+                                       ("População residente - Homens", '2022'),
+                                       ("População residente - Mulheres", '2022')]
+        assert list(df.columns.names) == [None, None]
+    
+    def test_float_block(self, api):
+        # Localidades sem valor em algum período recebem NaN no bloco numérico
+        api.dados = variavel(resultado("Homens", {'Rondônia': {'2010': '100', '2022': '200'}, 'Acre': {'2022': '300'}}))
+        df = api.get_data("1234;93", level='N3', named_var=False)
+        assert (df.dtypes == np.float64).all()
+        np.testing.assert_array_equal(df.to_numpy(), [[100., 200.], [np.nan, 300.]])
+    
+    def test_special_values(self, api):
+        df = api.get_data("1234;93", level='N3', named_var=False)
+        expected = pd.DataFrame([[100., np.nan, 0., 150.], [np.nan, np.nan, 300., 250.]],
+                                index=['Rondônia', 'Acre'],
+                                columns=pd.MultiIndex.from_tuples([('Homens', '2010'), ('Mulheres', '2010'),
+                                                                   ('Homens', '2022'), ('Mulheres', '2022')]))
+        pd.testing.assert_frame_equal(df, expected)
+    
+    def test_keep_special(self, api):
+        df = api.get_data("1234;93", level='N3', named_var=False, keep_special=True)
+        assert df.loc['Rondônia', ('Homens', '2022')] == '-'
+        assert df.loc['Acre', ('Mulheres', '2010')] == '...'
+    
+    def test_total_category(self, api):
+        # A categoria 'Total' só nomeia a coluna quando não há agregação por nenhuma classificação
+        api.dados = variavel(resultado("Total", {'Rondônia': {'2022': '100'}}))
+        df = api.get_data("1234;93", level='N3')
+        assert df.columns.tolist() == [("População residente - Total", '2022')]
+    
+    def test_invalid_level(self, api):
+        with pytest.raises(ValueError, match="nível geográfico"):
+            api.get_data("1234;93", level='N6')
+        # A requisição antecipada dos dados é descartada sem leitura do conteúdo
+        # (a resposta pode ser fechada pela thread da requisição logo após o erro)
+        assert len(api.respostas) == 1
+        for _ in range(100):
+            if api.respostas[0].raw.closed:
+                break
+            time.sleep(0.01)
+        assert api.respostas[0].raw.closed
+    
+    def test_unknown_level(self, api):
+        with pytest.raises(ValueError, match="nível geográfico"):
+            api.get_data("1234;93", level='Inexistente')
+        assert api.respostas == []
\ No newline at end of file
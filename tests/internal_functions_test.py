@@ -0,0 +1,101 @@
+import gc
+import weakref
+import datetime as dt
+
+import pytest
+
+from apisbr.core import API, DateParser, TextIndex, is_similar_text, similar_text_matcher, parse_period_input
+from apisbr.utils import remove_accents
+
+@pytest.mark.parametrize("period,expected", [
+    ("2021", (dt.datetime(2021, 1, 1), dt.datetime(2021, 12, 31))),
+    ("2019-2021", (dt.datetime(2019, 1, 1), dt.datetime(2021, 12, 31))),
+    ("all", (dt.datetime.min, dt.datetime.max)),
+    ])
+class TestParsePeriodInput():
+    @pytest.mark.core
+    def test_parse_period(self, period, expected):
+        assert parse_period_input(period) == expected
+    
+    def test_parse_period_matches_dateparser(self, period, expected):
+        # Força o uso do dateparser, sem o atalho para anos
+        date_parser = DateParser({**DateParser.settings, 'PREFER_DATES_FROM': 'current_period'})
+        assert parse_period_input(period, date_parser) == expected
+
+
+class TestDateParserLanguages():
+    def test_default_languages(self):
+        assert DateParser().parse("março de 2021") == dt.datetime(2021, 3, 31)
+    
+    def test_update_dateparser_languages(self, monkeypatch):
+        # Instância própria do parser, sem alterar o parser compartilhado pelas APIs
+        api = API()
+        monkeypatch.setattr(api, 'date_parser', DateParser())
+        api.update_dateparser(DateParser.settings, languages=['en'])
+        assert api.date_parser.parse("março de 2021") is None
+        assert api.date_parser.parse("March 2021") == dt.datetime(2021, 3, 31)
+
+@pytest.mark.parametrize("target,current", [
+    ("bolsa família", "Programa Bolsa Familia"),
+    ("pop res", "População residente"),
+    ("Bolsa", "Auxílio Brasil"),
+    ("", "Qualquer título"),
+    ])
+def test_similar_text_matcher(target, current):
+    assert similar_text_matcher(target)(current) == is_similar_text(target, current)
+
+
+class TestTextIndex():
+    titles = ["População residente", "Programa Bolsa Familia", "Auxílio Brasil", "Bolsa Atleta"]
+    
+    @pytest.mark.core
+    def test_get_exact(self):
+        index = TextIndex(self.titles)
+        assert index.get_exact("população RESIDENTE") == "População residente"
+        assert index.get_exact("População") is None
+    
+    @pytest.mark.parametrize("target", ["bolsa", "pop res", "bolsa família", "brasil auxilio", "inexistente", ""])
+    def test_get_similar_matches_is_similar_text(self, target):
+        # O índice deve retornar os mesmos títulos da verificação direta, na ordem original
+        index = TextIndex(self.titles)
+        assert index.get_similar(target) == [title for title in self.titles if is_similar_text(target, title)]
+    
+    def test_no_reference_cycle(self):
+        # Os caches da instância não devem mantê-la viva até a próxima coleta do gc
+        index = TextIndex(self.titles)
+        index.get_similar("bolsa")
+        referencia = weakref.ref(index)
+        gc.disable()
+        try:
+            del index
+            assert referencia() is None
+        finally:
+            gc.enable()
+    
+    def test_get_similar_returns_copy(self):
+        index = TextIndex(self.titles)
+        index.get_similar("bolsa").clear()
+        assert index.get_similar("bolsa") == ["Programa Bolsa Familia", "Bolsa Atleta"]
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Sao Paulo", "Sao Paulo"),
+    ("São João d'Aliança", "Sao Joao d'Alianca"),
+    ("Ação", "Acao"),
+    ("ক্", "ক"), # Marca não espaçada fora do bloco Combining Diacritical Marks
+    ])
+def test_remove_accents(text, expected):
+    assert remove_accents(text) == expected
+
+
+class TestNoMatchFoundError():
+    def test_message_without_semelhantes(self):
+        e = API.NoMatchFoundError()
+        assert str(e) == "Nenhuma correspondência encontrada."
+    
+    def test_message_with_semelhantes(self):
+        e = API.NoMatchFoundError({"Bolsa Atleta": 1, "Bolsa Familia": 2})
+        assert str(e) == ("Nenhuma correspondência encontrada. Seguem possíveis resultados:\n"
+                          "Bolsa Atleta : 1\nBolsa Familia : 2")
+        # A lista de semelhantes fica apenas no atributo, não nos argumentos do erro
+        assert e.args == ("Nenhuma correspondência encontrada.",)
\ No newline at end of file
@@ -0,0 +1,51 @@
+import inspect
+
+import pytest
+
+from apisbr.core import LazyClassAttribute
+from apisbr.labels import IBGELocalidades, get_muni_id, get_muni_name
+
+def municipio(nome: str, uf: str, id_: int) -> dict:
+    return {'nome': nome, 'id': id_, 'regiao-imediata': {'regiao-intermediaria': {'UF': {'sigla': uf}}}}
+
+@pytest.fixture(autouse=True)
+def localidades(tmp_path, monkeypatch):
+    # Dicionários recarregados a partir de uma resposta simulada, sem acesso à API nem ao cache do usuário
+    monkeypatch.setenv("APISBR_CACHE_DIR", str(tmp_path))
+    municipios = [municipio("Cabixi", "RO", 1100031), municipio("Espigão D'Oeste", "RO", 1100098)]
+    monkeypatch.setattr(IBGELocalidades.session, 'get_json', lambda url: municipios)
+    for attr in ('_name2id', '_id2name', '_id6_2name'):
+        loader = inspect.getattr_static(IBGELocalidades, attr).loader
+        monkeypatch.setattr(IBGELocalidades, attr, LazyClassAttribute(loader))
+
+@pytest.mark.parametrize("name,id_", [
+    ("Cabixi - RO", 1100031),
+    ("Espigao D'Oeste - RO", 1100098),
+    ])
+class TestNameIdLookup():
+    @pytest.mark.core
+    def test_name_to_id(self, name, id_):
+        assert IBGELocalidades.name_to_id(name) == id_
+        assert IBGELocalidades.name_to_id(name, verifier=False) == id_//10
+    
+    def test_id_to_name(self, name, id_):
+        assert IBGELocalidades.id_to_name(id_) == name
+        assert IBGELocalidades.id_to_name(id_//10, verifier=False) == name
+    
+    def test_get_muni_name(self, name, id_):
+        assert get_muni_name(id_) == name
+        assert get_muni_name(str(id_//10)) == name
+
+
+class TestGetMuniId():
+    def test_get_muni_id(self):
+        assert get_muni_id("Espigão d'Oeste", "ro") == 1100098
+        assert get_muni_id("cabixi", "RO", verifier=False) == 110003
+    
+    def test_invalid_uf(self):
+        with pytest.raises(ValueError, match="Sigla de UF inválida: 'XX'."):
+            get_muni_id("Cabixi", "xx")
+    
+    def test_unknown_municipio(self):
+        with pytest.raises(KeyError):
+            get_muni_id("Cabixi", "SC")
\ No newline at end of file